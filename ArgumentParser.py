@@ -2,6 +2,41 @@
 Argument parser configuration for SpaceX CLI.
 """
 import argparse
+from datetime import datetime, timezone
+import config
+from actions.GroupKeys import GROUP_KEYS
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 date or datetime, treating naive values as UTC.
+    
+    Returns:
+        Timezone-aware datetime
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00') if value.endswith('Z') else value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 timestamp: '{value}'")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer.
+    
+    Returns:
+        Integer value
+    """
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return parsed
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -33,12 +68,82 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '--action',
         type=str,
-        required=True,
-        choices=['report', 'payloads', 'launchpads'],
+        choices=['report', 'payloads', 'launchpads', 'groupby', 'rolling'],
         help='Action to perform on the data'
     )
+    parser.add_argument(
+        '--all-years',
+        action='store_true',
+        help='Process launches from all years instead of only 2022'
+    )
+    parser.add_argument(
+        '--group-by',
+        type=str,
+        choices=list(GROUP_KEYS.keys()),
+        help='Key to count launches by for the groupby action (default: launchpad)'
+    )
+    parser.add_argument(
+        '--approx',
+        action='store_true',
+        help='Use fixed-memory sketches (top-K and distinct count) for launchpads/groupby'
+    )
+    parser.add_argument(
+        '--top-k',
+        type=positive_int,
+        help=f'Number of keys to output for launchpads/groupby (default: all, or {config.APPROX_TOP_K} with --approx)'
+    )
+    parser.add_argument(
+        '--window',
+        type=positive_int,
+        help=f'Rolling window size in launches for the rolling action (default: {config.ROLLING_WINDOW})'
+    )
+    parser.add_argument(
+        '--batch',
+        type=str,
+        help='Run a batch of queries from a JSON file (use - for stdin) in a single scan'
+    )
+    parser.add_argument(
+        '--as-of',
+        type=parse_timestamp,
+        help='Query the cached data as it was at this ISO 8601 time, from snapshot history'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Poll the API and print updated results whenever launches change'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=config.WATCH_INTERVAL,
+        help=f'Polling interval in seconds for --watch (default: {config.WATCH_INTERVAL})'
+    )
     return parser
 
 
 def parse_args():
-    return create_parser().parse_args()
+    parser = create_parser()
+    args = parser.parse_args()
+    if args.action is None and args.batch is None:
+        parser.error('one of the arguments --action --batch is required')
+    if args.action is not None and args.batch is not None:
+        parser.error('argument --batch: not allowed with argument --action')
+    if args.watch and args.batch is not None:
+        parser.error('argument --watch: not allowed with argument --batch')
+    if (args.approx or args.top_k is not None) and args.action not in ('launchpads', 'groupby'):
+        parser.error('arguments --approx/--top-k: only supported with --action launchpads or groupby')
+    if args.group_by is not None and args.action != 'groupby':
+        parser.error('argument --group-by: only supported with --action groupby')
+    if args.window is not None and args.action != 'rolling':
+        parser.error('argument --window: only supported with --action rolling')
+    if args.watch and args.action == 'rolling':
+        parser.error('argument --watch: not supported with --action rolling')
+    if args.watch and args.approx:
+        parser.error('argument --watch: not allowed with argument --approx')
+    if args.refresh and args.as_of is not None:
+        parser.error('argument --refresh: not allowed with argument --as-of')
+    if args.watch and args.as_of is not None:
+        parser.error('argument --watch: not allowed with argument --as-of')
+    if args.interval < 0:
+        parser.error('argument --interval: must not be negative')
+    return args
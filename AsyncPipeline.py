@@ -0,0 +1,88 @@
+"""
+Asyncio-native pipeline processing launch data as it streams in.
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Callable
+from data.AsyncLaunchDataAccess import AsyncLaunchDataAccess
+from actions.ActionRegistry import ActionRegistry
+from filters.FilterRegistry import FilterRegistry
+from filters.LaunchDate import parse_launch_date
+
+
+class AsyncPipeline:
+    """
+    Async pipeline with the same fluent stages as Pipeline.
+
+    Stages are configured synchronously and executed by awaiting run(). Records
+    are filtered and fed to the action as they arrive from the fetch stage, and
+    fetch errors are raised as LaunchDataError instead of exiting the process.
+    Pipelines sharing one AsyncLaunchDataAccess share its cache and connection pool.
+
+    Example:
+        async with AsyncLaunchDataAccess('./cache/launches.json') as data_access:
+            results = await asyncio.gather(
+                AsyncPipeline(data_access).fetch_data().filter_data('by_year', year=2021).perform_action('report').run(),
+                AsyncPipeline(data_access).fetch_data().filter_data('by_year', year=2022).perform_action('report').run(),
+            )
+    """
+
+    def __init__(self, data_access: AsyncLaunchDataAccess):
+        self.logger = logging.getLogger(__name__)
+        self.data_access = data_access
+        self.refresh: Optional[bool] = None
+        self.predicates: List[Callable[[Dict[str, Any], Optional[datetime]], bool]] = []
+        self.action: Optional[str] = None
+        self.options: Dict[str, Any] = {}
+        self.result: Optional[str] = None
+
+    def fetch_data(self, refresh: bool = False) -> 'AsyncPipeline':
+        self.logger.debug(f"Configuring fetch (refresh={refresh})")
+        self.refresh = refresh
+        return self
+
+    def filter_data(self, filter_name: str, **kwargs) -> 'AsyncPipeline':
+        self.logger.debug(f"Configuring filter: {filter_name} with args: {kwargs}")
+
+        if self.refresh is None:
+            raise ValueError("Data must be fetched before filtering")
+
+        self.predicates.append(FilterRegistry.get_predicate(filter_name, **kwargs))
+        return self
+
+    def perform_action(self, action: str, **options) -> 'AsyncPipeline':
+        self.logger.debug(f"Configuring action: {action} with options: {options}")
+
+        if self.refresh is None:
+            raise ValueError("Data must be fetched and filtered before performing action")
+
+        # Instantiate eagerly so an unknown action or bad option fails before any I/O
+        ActionRegistry.get_action(action)(**options)
+        self.action = action
+        self.options = options
+        return self
+
+    async def run(self) -> str:
+        """
+        Execute the pipeline.
+
+        Returns:
+            Formatted action result
+
+        Raises:
+            LaunchDataError: If launch data could not be fetched
+        """
+        if self.action is None:
+            raise ValueError("Action must be set before running")
+
+        handler = ActionRegistry.get_action(self.action)(**self.options)
+        scanned = 0
+        async for launch in self.data_access.fetch(refresh=self.refresh):
+            scanned += 1
+            launch_date = parse_launch_date(launch)
+            if all(predicate(launch, launch_date) for predicate in self.predicates):
+                handler.add(launch)
+
+        self.logger.debug(f"Action {self.action} completed over {scanned} launches")
+        self.result = handler.result()
+        return self.result
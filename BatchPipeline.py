@@ -0,0 +1,196 @@
+"""
+Batch pipeline for running many queries over a single scan of the launch data.
+"""
+import sys
+import json
+import logging
+from typing import Iterator, Dict, Any, Optional, List, Tuple
+from Pipeline import Pipeline
+from actions.ActionRegistry import ActionRegistry
+from filters.FilterRegistry import FilterRegistry
+from filters.LaunchDate import parse_launch_date
+
+
+# Accepted JSON types for filter arguments, keyed by argument name
+FILTER_ARG_TYPES: Dict[str, Tuple[type, ...]] = {
+    'year': (int,),
+    'status': (bool, type(None)),
+}
+
+
+class BatchQuery:
+    """A single query in a batch: an optional filter plus an action."""
+
+    def __init__(
+        self,
+        name: str,
+        action: str,
+        filter_name: Optional[str] = None,
+        filter_args: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize batch query.
+
+        Args:
+            name: Key the query's result is reported under
+            action: Action name (see ActionRegistry)
+            filter_name: Filter name (see FilterRegistry), None to match all launches
+            filter_args: Keyword arguments for the filter
+            options: Keyword arguments for the action handler
+        """
+        self.name = name
+        self.action = action
+        self.filter_name = filter_name
+        self.filter_args = filter_args or {}
+        self.options = options or {}
+
+    def filter_key(self) -> Optional[Tuple[str, str]]:
+        """Hashable identity of the query's filter, used to share predicate evaluation."""
+        if self.filter_name is None:
+            return None
+        return self.filter_name, json.dumps(self.filter_args, sort_keys=True)
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any], index: int) -> 'BatchQuery':
+        """
+        Build a query from its JSON representation.
+
+        Args:
+            spec: Dictionary with 'action' and optional 'name', 'filter', 'args' and 'options'
+            index: Position of the query in the batch, used for the default name
+
+        Raises:
+            ValueError: If the specification is malformed
+        """
+        if not isinstance(spec, dict) or 'action' not in spec:
+            raise ValueError(f"Batch query {index} must be an object with an 'action'")
+
+        if spec['action'] not in ActionRegistry.list_actions():
+            raise ValueError(f"Batch query {index}: unknown action: {spec['action']}")
+
+        filter_name = spec.get('filter')
+        if filter_name is not None and filter_name not in FilterRegistry.list_filters():
+            raise ValueError(f"Batch query {index}: unknown filter: {filter_name}")
+
+        filter_args = spec.get('args', {})
+        if not isinstance(filter_args, dict):
+            raise ValueError(f"Batch query {index}: 'args' must be an object")
+        for arg, value in filter_args.items():
+            allowed = FILTER_ARG_TYPES.get(arg)
+            # bool is an int subclass, so reject it explicitly where only int is allowed
+            if allowed is not None and (
+                not isinstance(value, allowed) or (isinstance(value, bool) and bool not in allowed)
+            ):
+                raise ValueError(
+                    f"Batch query {index}: invalid type for filter arg '{arg}': {type(value).__name__}"
+                )
+
+        options = spec.get('options', {})
+        if not isinstance(options, dict):
+            raise ValueError(f"Batch query {index}: 'options' must be an object")
+
+        return cls(
+            name=str(spec.get('name', f"query-{index}")),
+            action=spec['action'],
+            filter_name=filter_name,
+            filter_args=filter_args,
+            options=options
+        )
+
+
+class BatchPipeline(Pipeline):
+    """Pipeline that executes a batch of queries in one pass over the data."""
+
+    def __init__(self, cache_path: str):
+        super().__init__(cache_path)
+        self.queries: List[BatchQuery] = []
+        self.results: Optional[Dict[str, str]] = None
+
+    def load_queries(self, source: str) -> 'BatchPipeline':
+        """
+        Load queries from a JSON file containing a list of query objects.
+
+        Example:
+            [{"name": "2022", "filter": "by_year", "args": {"year": 2022}, "action": "report"}]
+
+        Args:
+            source: Path to the batch file, or '-' to read from stdin
+
+        Raises:
+            ValueError: If the batch is malformed or not valid JSON
+            OSError: If the batch file cannot be read
+        """
+        self.logger.debug(f"Loading batch queries from: {source}")
+
+        if source == '-':
+            specs = json.load(sys.stdin)
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                specs = json.load(f)
+
+        if not isinstance(specs, list):
+            raise ValueError("Batch file must contain a list of queries")
+
+        queries = [BatchQuery.from_dict(spec, index) for index, spec in enumerate(specs)]
+        names = [query.name for query in queries]
+        if len(set(names)) != len(names):
+            raise ValueError("Batch query names must be unique")
+
+        self.queries = queries
+        self.logger.debug(f"Loaded {len(queries)} batch queries")
+        return self
+
+    def run_queries(self) -> 'BatchPipeline':
+        """
+        Route every launch to each query whose filter matches, in a single scan.
+
+        The launch date is parsed once per launch and shared by all predicates,
+        and queries with an identical filter share one predicate evaluation.
+        """
+        if self.data_iterator is None:
+            raise ValueError("Data must be fetched before running queries")
+
+        # Group handlers by filter so each distinct predicate runs once per launch
+        groups: Dict[Optional[Tuple[str, str]], Tuple[Any, list]] = {}
+        handlers: Dict[str, Any] = {}
+        for query in self.queries:
+            try:
+                handler = ActionRegistry.get_action(query.action)(**query.options)
+            except TypeError as e:
+                raise ValueError(f"Invalid options for action in query '{query.name}': {e}")
+            handlers[query.name] = handler
+
+            key = query.filter_key()
+            if key not in groups:
+                predicate = None
+                if query.filter_name is not None:
+                    try:
+                        predicate = FilterRegistry.get_predicate(query.filter_name, **query.filter_args)
+                    except TypeError as e:
+                        raise ValueError(f"Invalid args for filter in query '{query.name}': {e}")
+                groups[key] = (predicate, [])
+            groups[key][1].append(handler)
+
+        self.logger.debug(f"Running {len(self.queries)} queries with {len(groups)} distinct filters")
+
+        routes = list(groups.values())
+        scanned = 0
+        for launch in self.data_iterator:
+            scanned += 1
+            launch_date = parse_launch_date(launch)
+            for predicate, group_handlers in routes:
+                if predicate is None or predicate(launch, launch_date):
+                    for handler in group_handlers:
+                        handler.add(launch)
+
+        self.logger.debug(f"Batch scan complete, scanned {scanned} launches")
+        self.results = {name: handler.result() for name, handler in handlers.items()}
+        return self
+
+    def print_result(self) -> None:
+
+        if self.results is None:
+            raise ValueError("No result to print")
+
+        print(json.dumps(self.results, indent=2))
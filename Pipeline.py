@@ -3,8 +3,10 @@ Pipeline for orchestrating data fetching and processing with fluent interface.
 """
 import sys
 import logging
-from typing import Iterator, Dict, Any, Optional, Callable
+from datetime import datetime
+from typing import Iterator, Dict, Any, Optional, Callable, Union, List, Tuple
 from data.LaunchDataAccess import LaunchDataAccess
+from data.AggregateCube import Cell
 from actions.ActionRegistry import ActionRegistry
 from filters.FilterRegistry import FilterRegistry
 
@@ -12,21 +14,48 @@ from filters.FilterRegistry import FilterRegistry
 class Pipeline:
     """Pipeline for processing launch data with fluent interface."""
     
+    # Filters whose 'year' argument selects a single cache partition
+    PARTITIONED_FILTERS = ('by_year', 'by_year_and_status')
+    
     def __init__(self, cache_path: str):
         self.logger = logging.getLogger(__name__)
         self.data_access = LaunchDataAccess(cache_path=cache_path)
         self.data_iterator: Optional[Iterator[Dict[str, Any]]] = None
-        self.result: Optional[str] = None
+        # Actions return a string, or an iterator of lines for streamed output
+        self.result: Optional[Union[str, Iterator[str]]] = None
+        # Partition state: whether the full cache load is still deferred, and the
+        # (year, status) of the single partition filter applied so far
+        self.partitioned = False
+        self.partition_query: Optional[tuple] = None
+        # Filters applied so far while an aggregate cube for the cache is available
+        self.cube_filters: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+        # Partition manifest and cube cells, each loaded once by fetch_data
+        self.manifest: Optional[Dict[str, Any]] = None
+        self.cube: Optional[List[Cell]] = None
     
-    def fetch_data(self, refresh: bool = False) -> 'Pipeline':
-        self.logger.debug(f"Fetching data (refresh={refresh})")
+    def fetch_data(self, refresh: bool = False, as_of: Optional[datetime] = None) -> 'Pipeline':
+        self.logger.debug(f"Fetching data (refresh={refresh}, as_of={as_of})")
         
         def handle_error(error_code: int, error_message: str):
             self.logger.error("error in processing")
             self.logger.debug(f"Error {error_code}: {error_message}")
             sys.exit(error_code)
         
-        data_iterator = self.data_access.fetch(refresh=refresh, onError=handle_error)
+        if not refresh and as_of is None:
+            self.manifest = self.data_access.load_manifest()
+            self.cube = self.data_access.load_cube()
+            if self.manifest is not None or self.cube is not None:
+                # Defer loading until filters and action are known: a year filter only
+                # opens its partition, and a cube-served action reads no launches at all
+                self.logger.debug(
+                    f"Deferring load (partitions={self.manifest is not None}, cube={self.cube is not None})"
+                )
+                self.partitioned = self.manifest is not None
+                self.cube_filters = []
+                self.data_iterator = self._deferred_fetch(handle_error)
+                return self
+        
+        data_iterator = self.data_access.fetch(refresh=refresh, onError=handle_error, as_of=as_of)
         if data_iterator:
             self.data_iterator = data_iterator
             self.logger.debug("Data fetched successfully")
@@ -36,31 +65,103 @@ class Pipeline:
         
         return self
     
+    def _deferred_fetch(self, handle_error: Callable[[int, str], None]) -> Iterator[Dict[str, Any]]:
+        data_iterator = self.data_access.fetch(refresh=False, onError=handle_error)
+        if not data_iterator:
+            sys.exit(1)
+        yield from data_iterator
+    
+    def _partition_fetch(self, year: int, fallback: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        partition = self.data_access.fetch_partition(year, self.manifest)
+        if partition is None:
+            self.logger.debug("Cache partition unavailable, reading the full cache")
+            partition = fallback
+        else:
+            self.logger.debug(f"Reading only the cache partition for year {year}")
+        yield from partition
+    
     def filter_data(self, filter_name: str, **kwargs) -> 'Pipeline':
         self.logger.debug(f"Applying filter: {filter_name} with args: {kwargs}")
         
         if self.data_iterator is None:
             raise ValueError("Data must be fetched before filtering")
         
+        if self.cube_filters is not None:
+            self.cube_filters.append((filter_name, dict(kwargs)))
+        
+        self.partition_query = None
+        if self.partitioned and filter_name in self.PARTITIONED_FILTERS and 'year' in kwargs:
+            # Only record the year here: the partition is opened when the data is
+            # first read, so manifest- and cube-served actions never load it
+            self.data_iterator = self._partition_fetch(kwargs['year'], self.data_iterator)
+            self.partition_query = (kwargs['year'], kwargs.get('status'))
+        self.partitioned = False
+        
         filter_func = FilterRegistry.get_filter(filter_name, **kwargs)
         self.data_iterator = filter_func(self.data_iterator)
         self.logger.debug(f"filter: {filter_name} applied.")
         return self
     
-    def perform_action(self, action: str) -> 'Pipeline':
-        self.logger.debug(f"Performing action: {action}")
+    def perform_action(self, action: str, **options) -> 'Pipeline':
+        self.logger.debug(f"Performing action: {action} with options: {options}")
         
         if self.data_iterator is None:
             raise ValueError("Data must be fetched and filtered before performing action")
         
         handler_class = ActionRegistry.get_action(action)
-        self.result = handler_class.execute(self.data_iterator)
+        
+        if self.cube_filters is not None and hasattr(handler_class, 'add_cell'):
+            result = self._execute_from_cube(handler_class, options)
+            if result is not None:
+                self.result = result
+                self.logger.debug(f"Action {action} answered from aggregate cube")
+                return self
+        
+        if self.partition_query is not None and not options and hasattr(handler_class, 'execute_stats'):
+            result = self._execute_from_manifest(handler_class)
+            if result is not None:
+                self.result = result
+                self.logger.debug(f"Action {action} answered from partition manifest")
+                return self
+        
+        self.result = handler_class.execute(self.data_iterator, **options)
         self.logger.debug(f"Action {action} completed")
         return self
     
+    def _execute_from_cube(self, handler_class, options: Dict[str, Any]) -> Optional[str]:
+        if self.cube is None:
+            return None
+        cells = self.data_access.cube_cells(self.cube_filters, self.cube)
+        if cells is None:
+            return None
+        
+        handler = handler_class(**options)
+        for _, _, launchpad_id, success, count, payloads in cells:
+            handler.add_cell(launchpad_id, success, count, payloads)
+        return handler.result()
+    
+    def _execute_from_manifest(self, handler_class) -> Optional[str]:
+        year, status = self.partition_query
+        stats = self.data_access.partition_stats(year, self.manifest)
+        if stats is None:
+            return None
+        
+        successful, failed, unknown = stats['successful'], stats['failed'], stats['unknown']
+        if status is True:
+            failed = unknown = 0
+        elif status is False:
+            successful = unknown = 0
+        elif status is not None:
+            return None
+        return handler_class.execute_stats(successful=successful, failed=failed, unknown=unknown)
+    
     def print_result(self) -> None:
 
         if self.result is None:
             raise ValueError("No result to print")
         
-        print(self.result)
+        if isinstance(self.result, str):
+            print(self.result)
+        else:
+            for line in self.result:
+                print(line)
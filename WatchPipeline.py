@@ -0,0 +1,136 @@
+"""
+Watch pipeline for polling the API and incrementally maintaining action results.
+"""
+import time
+from datetime import datetime, timezone
+from typing import Iterator, Dict, Any, Optional, List, Callable
+from Pipeline import Pipeline
+from actions.ActionRegistry import ActionRegistry
+from filters.FilterRegistry import FilterRegistry
+from filters.LaunchDate import parse_launch_date
+
+
+class WatchPipeline(Pipeline):
+    """Pipeline that re-polls launch data and applies only the changes to a running action."""
+
+    def __init__(self, cache_path: str):
+        super().__init__(cache_path)
+        self.predicates: List[Callable[[Dict[str, Any], Optional[datetime]], bool]] = []
+        self.handler = None
+        self.launches: Dict[str, Dict[str, Any]] = {}
+
+    def filter_data(self, filter_name: str, **kwargs) -> 'WatchPipeline':
+        self.logger.debug(f"Watching with filter: {filter_name} with args: {kwargs}")
+        self.predicates.append(FilterRegistry.get_predicate(filter_name, **kwargs))
+        return self
+
+    def perform_action(self, action: str, **options) -> 'WatchPipeline':
+        self.logger.debug(f"Watching action: {action} with options: {options}")
+        self.handler = ActionRegistry.get_action(action)(**options)
+        return self
+
+    def _matches(self, launch: Dict[str, Any]) -> bool:
+        launch_date = parse_launch_date(launch)
+        return all(predicate(launch, launch_date) for predicate in self.predicates)
+
+    def apply(self, data: Iterator[Dict[str, Any]]) -> tuple[int, int, int]:
+        """
+        Diff a fresh launch set against the previous one by 'id' and update the action.
+
+        A changed launch first has its old contribution retracted, then its new one
+        added, so e.g. a 'success' flip from null to true moves it between buckets.
+        Launches without an 'id' cannot be tracked and are skipped.
+
+        Args:
+            data: Iterator of launch dictionaries for the current poll
+
+        Returns:
+            Tuple of (inserted, changed, removed) counts
+        """
+        current: Dict[str, Dict[str, Any]] = {}
+        for launch in data:
+            launch_id = launch.get('id')
+            if launch_id is None:
+                self.logger.debug("Skipping launch without id")
+                continue
+            current[launch_id] = launch
+
+        inserted = changed = 0
+        for launch_id, launch in current.items():
+            old = self.launches.get(launch_id)
+            if old is None:
+                inserted += 1
+            elif old != launch:
+                changed += 1
+                if self._matches(old):
+                    self.handler.remove(old)
+            else:
+                continue
+            if self._matches(launch):
+                self.handler.add(launch)
+
+        removed = 0
+        for launch_id, old in self.launches.items():
+            if launch_id not in current:
+                removed += 1
+                if self._matches(old):
+                    self.handler.remove(old)
+
+        self.launches = current
+        return inserted, changed, removed
+
+    def watch(self, interval: float, refresh: bool = False, max_ticks: Optional[int] = None) -> None:
+        """
+        Poll launch data on an interval and print the result whenever it changes.
+
+        The first poll honours the cache like a normal run; later polls always go
+        to the API. API data is only persisted (cache, partitions, aggregate cube
+        and snapshot history) when the poll changed something, so an idle tick
+        costs one request and one diff. Fetch errors are logged and the next poll
+        is attempted.
+
+        Args:
+            interval: Seconds to wait between polls
+            refresh: If True, bypass the cache on the first poll as well
+            max_ticks: Stop after this many polls (None to run until interrupted)
+        """
+        if self.handler is None:
+            raise ValueError("Action must be set before watching")
+
+        def handle_error(error_code: int, error_message: str):
+            self.logger.error("error in processing")
+            self.logger.debug(f"Error {error_code}: {error_message}")
+
+        tick = 0
+        try:
+            while max_ticks is None or tick < max_ticks:
+                if tick > 0:
+                    time.sleep(interval)
+                data = None
+                if tick == 0 and not refresh:
+                    data_iterator = self.data_access.fetch(refresh=False, onError=handle_error)
+                else:
+                    data, error_code, error_message = self.data_access.api_caller.fetch(self.data_access.api_url)
+                    if error_code:
+                        handle_error(error_code, error_message)
+                        data = None
+                    data_iterator = iter(data) if data is not None else None
+                tick += 1
+                if data_iterator is None:
+                    continue
+
+                inserted, changed, removed = self.apply(data_iterator)
+                self.logger.debug(f"Watch tick {tick}: {inserted} inserted, {changed} changed, {removed} removed")
+                if not (inserted or changed or removed):
+                    continue
+                if data:
+                    self.data_access.persist(data)
+
+                result = self.handler.result()
+                if result != self.result:
+                    self.result = result
+                    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                    print(f"[{timestamp}] {inserted} inserted, {changed} changed, {removed} removed", flush=True)
+                    print(result, flush=True)
+        except KeyboardInterrupt:
+            self.logger.debug("Watch interrupted")
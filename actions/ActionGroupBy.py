@@ -0,0 +1,137 @@
+"""
+Action handler for 'groupby' action - counts launches per key, exactly or with sketches.
+"""
+import logging
+from typing import Iterator, Dict, Any, Optional
+from collections import Counter
+from .GroupKeys import GROUP_KEYS
+from sketches.SpaceSaving import SpaceSaving
+from sketches.HyperLogLog import HyperLogLog
+import config
+
+
+class ActionGroupBy:
+    """
+    Handles 'groupby' action to count launches per group key.
+
+    In exact mode all keys are counted in a Counter. In approximate mode memory
+    is fixed regardless of key cardinality: a SpaceSaving sketch tracks the top
+    keys and a HyperLogLog sketch estimates the number of distinct keys (see
+    those classes for error bounds).
+    """
+
+    def __init__(
+        self,
+        key: str = 'launchpad',
+        approx: bool = False,
+        top_k: Optional[int] = None
+    ):
+        """
+        Initialize group-by handler.
+
+        Args:
+            key: Group key, one of GROUP_KEYS
+            approx: Use bounded-memory sketches instead of exact counts
+            top_k: Number of keys to output (default: all when exact, APPROX_TOP_K when approximate)
+        """
+        if key not in GROUP_KEYS:
+            raise ValueError(f"Unknown group key: {key}")
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.key = key
+        self.extract = GROUP_KEYS[key]
+        self.approx = approx
+        self.top_k = top_k
+        if approx:
+            self.top_keys = SpaceSaving(config.APPROX_TOP_K_CAPACITY)
+            self.distinct_keys = HyperLogLog(config.APPROX_HLL_PRECISION)
+        else:
+            self.counts = Counter()
+
+    def header(self) -> str:
+        return f"{self.key}Id - count"
+
+    def add(self, launch: Dict[str, Any]) -> None:
+        """Count a single launch against each of its keys."""
+        if self.approx:
+            for key in self.extract(launch):
+                self.top_keys.add(key)
+                self.distinct_keys.add(key)
+        else:
+            for key in self.extract(launch):
+                self.counts[key] += 1
+
+    def remove(self, launch: Dict[str, Any]) -> None:
+        """Retract a previously counted launch (exact mode only)."""
+        if self.approx:
+            raise ValueError("Approximate group-by does not support retracting launches")
+        for key in self.extract(launch):
+            self.counts[key] -= 1
+            if self.counts[key] <= 0:
+                del self.counts[key]
+
+    def merge(self, other: 'ActionGroupBy') -> 'ActionGroupBy':
+        """Merge the state of another handler for the same key and mode into this one."""
+        if (other.key, other.approx) != (self.key, self.approx):
+            raise ValueError("Cannot merge group-by handlers with different key or mode")
+        if self.approx:
+            self.top_keys.merge(other.top_keys)
+            self.distinct_keys.merge(other.distinct_keys)
+        else:
+            self.counts.update(other.counts)
+        return self
+
+    def result(self) -> str:
+        """Format the counts accumulated so far."""
+        if self.approx:
+            return self._approx_result()
+
+        # Sort by count descending
+        sorted_counts = sorted(
+            self.counts.items(),
+            key=lambda x: x[1],
+            reverse=True
+        )
+        if self.top_k is not None:
+            sorted_counts = sorted_counts[:self.top_k]
+
+        # Format output
+        lines = [self.header()]
+        for key, count in sorted_counts:
+            lines.append(f"{key} - {count}")
+
+        return "\n".join(lines)
+
+    def _approx_result(self) -> str:
+        top_k = self.top_k if self.top_k is not None else config.APPROX_TOP_K
+        lines = [f"{self.header()} (approx, overcount <= {self.top_keys.max_error()})"]
+        for key, count, error in self.top_keys.top(top_k):
+            lines.append(f"{key} - {count}" + (f" (overcount <= {error})" if error else ""))
+        lines.append(
+            f"distinct {self.key}: ~{self.distinct_keys.count()} "
+            f"(std error {self.distinct_keys.relative_error():.2%})"
+        )
+        return "\n".join(lines)
+
+    @classmethod
+    def execute(cls, data: Iterator[Dict[str, Any]], **options) -> str:
+        """
+        Count launches per group key and generate report.
+
+        Args:
+            data: Iterator of launch dictionaries
+            **options: Handler options (key, approx, top_k)
+
+        Returns:
+            Formatted result string with per-key counts
+        """
+        logger = logging.getLogger(__name__)
+        logger.debug(f"Executing {cls.__name__} action with options: {options}")
+
+        handler = cls(**options)
+        for launch in data:
+            handler.add(launch)
+
+        if not handler.approx:
+            logger.debug(f"Found {len(handler.counts)} unique {handler.key} keys")
+        return handler.result()
@@ -1,56 +1,29 @@
 """
 Action handler for 'launchpads' action - groups launches by launchpad.
 """
-import logging
-from typing import Iterator, Dict, Any
-from collections import Counter
+from typing import Dict, Any, Optional
+from .ActionGroupBy import ActionGroupBy
+from .GroupKeys import GROUP_KEYS
 
 
-class ActionLaunchpads:
+class ActionLaunchpads(ActionGroupBy):
     """Handles 'launchpads' action to group launches by launchpad."""
-    
+
+    def __init__(self, approx: bool = False, top_k: Optional[int] = None):
+        super().__init__(key='launchpad', approx=approx, top_k=top_k)
+
     @staticmethod
-    def execute(data: Iterator[Dict[str, Any]]) -> str:
-        """
-        Group launches by launchpad ID and generate report.
-        
-        Args:
-            data: Iterator of launch dictionaries
-        
-        Returns:
-            Formatted result string with launchpad counts
-        """
-        logger = logging.getLogger(__name__)
-        logger.debug("Executing launchpads action")
-        
-        launchpad_counts = Counter()
-        
-        for launch in data:
-            launchpad = launch.get('launchpad')
-            
-            if not launchpad:
-                launchpad_id = "unknown"
-            elif isinstance(launchpad, str):
-                launchpad_id = launchpad
-            elif isinstance(launchpad, dict):
-                launchpad_id = launchpad.get('id', 'unknown')
-            else:
-                launchpad_id = "unknown"
-            
-            launchpad_counts[launchpad_id] += 1
-        
-        logger.debug(f"Found {len(launchpad_counts)} unique launchpads")
-        
-        # Sort by count descending
-        sorted_counts = sorted(
-            launchpad_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        # Format output
-        lines = ["launchpadId - count"]
-        for launchpad_id, count in sorted_counts:
-            lines.append(f"{launchpad_id} - {count}")
-        
-        return "\n".join(lines)
+    def launchpad_id(launch: Dict[str, Any]) -> str:
+        """Launchpad ID of a launch, or 'unknown' if missing."""
+        return GROUP_KEYS['launchpad'](launch)[0]
+
+    def add_cell(self, launchpad_id: str, success: Optional[bool], count: int, payloads: int) -> None:
+        """Add an aggregate cube cell of launches from the same launchpad."""
+        if self.approx:
+            self.top_keys.add(launchpad_id, count)
+            self.distinct_keys.add(launchpad_id)
+        else:
+            self.counts[launchpad_id] += count
+
+    def header(self) -> str:
+        return "launchpadId - count"
@@ -2,19 +2,56 @@
 Action handler for 'payloads' action - calculates average payloads per launch.
 """
 import logging
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, Optional
 
 
 class ActionPayloads:
     """Handles 'payloads' action to calculate average payloads."""
     
+    def __init__(self):
+        self.total_launches = 0
+        self.total_payloads = 0
+    
     @staticmethod
-    def execute(data: Iterator[Dict[str, Any]]) -> str:
+    def payload_count(launch: Dict[str, Any]) -> int:
+        """Number of payloads on a launch, treating missing payloads as zero."""
+        payloads = launch.get('payloads', [])
+        if not payloads:
+            return 0
+        # payloads can be a list of IDs or objects
+        return len(payloads) if isinstance(payloads, list) else 0
+    
+    def add(self, launch: Dict[str, Any]) -> None:
+        """Add a single launch to the running totals."""
+        self.total_launches += 1
+        self.total_payloads += self.payload_count(launch)
+    
+    def add_cell(self, launchpad_id: str, success: Optional[bool], count: int, payloads: int) -> None:
+        """Add an aggregate cube cell of launches and their payload sum."""
+        self.total_launches += count
+        self.total_payloads += payloads
+    
+    def remove(self, launch: Dict[str, Any]) -> None:
+        """Retract a previously added launch from the running totals."""
+        self.total_launches -= 1
+        self.total_payloads -= self.payload_count(launch)
+    
+    def result(self) -> str:
+        """Format the average accumulated so far."""
+        if self.total_launches > 0:
+            average = self.total_payloads / self.total_launches
+            return f"Average Payload per launch: {average:.2f}"
+        else:
+            return "Average Payload per launch: 0.00"
+    
+    @classmethod
+    def execute(cls, data: Iterator[Dict[str, Any]], **options) -> str:
         """
         Calculate average payloads per launch.
         
         Args:
             data: Iterator of launch dictionaries
+            **options: Handler options (none supported)
         
         Returns:
             Formatted result string
@@ -22,26 +59,12 @@ class ActionPayloads:
         logger = logging.getLogger(__name__)
         logger.debug("Executing payloads action")
         
-        total_launches = 0
-        total_payloads = 0
-        
+        handler = cls(**options)
         for launch in data:
-            total_launches += 1
-            payloads = launch.get('payloads', [])
-            
-            # Treat missing payloads as zero
-            if not payloads:
-                payload_count = 0
-            else:
-                # payloads can be a list of IDs or objects
-                payload_count = len(payloads) if isinstance(payloads, list) else 0
-            
-            total_payloads += payload_count
-        
-        logger.debug(f"Payload stats - Launches: {total_launches}, Total payloads: {total_payloads}")
+            handler.add(launch)
         
-        if total_launches > 0:
-            average = total_payloads / total_launches
-            return f"Average Payload per launch: {average:.2f}"
-        else:
-            return "Average Payload per launch: 0.00"
+        logger.debug(
+            f"Payload stats - Launches: {handler.total_launches}, "
+            f"Total payloads: {handler.total_payloads}"
+        )
+        return handler.result()
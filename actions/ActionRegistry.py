@@ -6,6 +6,8 @@ from typing import Dict, Type, Callable
 from .ActionReport import ActionReport
 from .ActionPayloads import ActionPayloads
 from .ActionLaunchpads import ActionLaunchpads
+from .ActionGroupBy import ActionGroupBy
+from .ActionRolling import ActionRolling
 
 
 class ActionRegistry:
@@ -15,6 +17,8 @@ class ActionRegistry:
         'report': lambda: ActionReport,
         'payloads': lambda: ActionPayloads,
         'launchpads': lambda: ActionLaunchpads,
+        'groupby': lambda: ActionGroupBy,
+        'rolling': lambda: ActionRolling,
     }
     
     @classmethod
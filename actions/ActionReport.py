@@ -2,19 +2,99 @@
 Action handler for 'report' action - generates launch statistics.
 """
 import logging
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, Optional
 
 
 class ActionReport:
     """Handles 'report' action to generate launch statistics."""
     
-    @staticmethod
-    def execute(data: Iterator[Dict[str, Any]]) -> str:
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.unknown = 0
+    
+    def add(self, launch: Dict[str, Any]) -> None:
+        """Add a single launch to the running statistics."""
+        self.total += 1
+        success = launch.get('success')
+        
+        if success is None:
+            self.unknown += 1
+        elif success:
+            self.successful += 1
+        else:
+            self.failed += 1
+    
+    def add_cell(self, launchpad_id: str, success: Optional[bool], count: int, payloads: int) -> None:
+        """Add an aggregate cube cell of launches sharing the same outcome."""
+        self.total += count
+        
+        if success is None:
+            self.unknown += count
+        elif success:
+            self.successful += count
+        else:
+            self.failed += count
+    
+    def remove(self, launch: Dict[str, Any]) -> None:
+        """Retract a previously added launch from the running statistics."""
+        self.total -= 1
+        success = launch.get('success')
+        
+        if success is None:
+            self.unknown -= 1
+        elif success:
+            self.successful -= 1
+        else:
+            self.failed -= 1
+    
+    def result(self) -> str:
+        """Format the statistics accumulated so far."""
+        # Calculate success ratio: success / (total - unknown)
+        denominator = self.total - self.unknown
+        if denominator > 0:
+            success_ratio = (self.successful / denominator) * 100
+            success_ratio_str = f"{success_ratio:.0f}%"
+        else:
+            success_ratio_str = "N/A"
+        
+        return (
+            f"Total: {self.total} | "
+            f"Successful: {self.successful} | "
+            f"Failed: {self.failed} | "
+            f"Unknown(success=none): {self.unknown} | "
+            f"Success ratio: {success_ratio_str}"
+        )
+    
+    @classmethod
+    def execute_stats(cls, successful: int, failed: int, unknown: int) -> str:
+        """
+        Generate report statistics from precomputed success counts.
+        
+        Args:
+            successful: Number of successful launches
+            failed: Number of failed launches
+            unknown: Number of launches with unknown outcome
+        
+        Returns:
+            Formatted report string
+        """
+        handler = cls()
+        handler.successful = successful
+        handler.failed = failed
+        handler.unknown = unknown
+        handler.total = successful + failed + unknown
+        return handler.result()
+    
+    @classmethod
+    def execute(cls, data: Iterator[Dict[str, Any]], **options) -> str:
         """
         Generate report statistics.
         
         Args:
             data: Iterator of launch dictionaries
+            **options: Handler options (none supported)
         
         Returns:
             Formatted report string
@@ -22,36 +102,12 @@ class ActionReport:
         logger = logging.getLogger(__name__)
         logger.debug("Executing report action")
         
-        total = 0
-        successful = 0
-        failed = 0
-        unknown = 0
-        
+        handler = cls(**options)
         for launch in data:
-            total += 1
-            success = launch.get('success')
-            
-            if success is None:
-                unknown += 1
-            elif success:
-                successful += 1
-            else:
-                failed += 1
-        
-        logger.debug(f"Report stats - Total: {total}, Successful: {successful}, Failed: {failed}, Unknown: {unknown}")
+            handler.add(launch)
         
-        # Calculate success ratio: success / (total - unknown)
-        denominator = total - unknown
-        if denominator > 0:
-            success_ratio = (successful / denominator) * 100
-            success_ratio_str = f"{success_ratio:.0f}%"
-        else:
-            success_ratio_str = "N/A"
-        
-        return (
-            f"Total: {total} | "
-            f"Successful: {successful} | "
-            f"Failed: {failed} | "
-            f"Unknown(success=none): {unknown} | "
-            f"Success ratio: {success_ratio_str}"
+        logger.debug(
+            f"Report stats - Total: {handler.total}, Successful: {handler.successful}, "
+            f"Failed: {handler.failed}, Unknown: {handler.unknown}"
         )
+        return handler.result()
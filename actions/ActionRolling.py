@@ -0,0 +1,164 @@
+"""
+Action handler for 'rolling' action - streams rolling launch statistics in launch order.
+"""
+import logging
+from collections import deque
+from typing import Iterator, Dict, Any, Optional, List
+from .ActionLaunchpads import ActionLaunchpads
+from filters.LaunchDate import parse_launch_date
+import config
+
+
+class ActionRolling:
+    """
+    Handles 'rolling' action to produce per-launch rolling statistics.
+
+    For each launch, in input order, outputs the success rate over the last
+    `window` launches, the time since the previous launch and the average gap
+    between the last `window` launches from the same launchpad. Every window is
+    kept as a deque with running sums, so each launch is O(1) and a full pass is
+    O(n). Streamed through execute(), memory is bounded by the window size and
+    number of launchpads; add()/result(), used by batch and async pipelines,
+    buffer every output line and so hold O(n) lines.
+
+    The API lists launches by flight number, which is mostly but not strictly
+    chronological (rescheduled and upcoming launches appear out of date order).
+    Upcoming launches and launches dated before the latest one seen so far get
+    no gap or cadence and do not move the timestamps, so gaps are never negative.
+    """
+
+    def __init__(self, window: int = config.ROLLING_WINDOW):
+        """
+        Initialize rolling statistics handler.
+
+        Args:
+            window: Number of launches (or launchpad gaps) in each rolling window
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.outcomes: deque = deque()
+        self.window_successful = 0
+        self.window_known = 0
+        self.previous_timestamp: Optional[float] = None
+        self.pad_last_timestamp: Dict[str, float] = {}
+        self.pad_gaps: Dict[str, deque] = {}
+        self.pad_gap_sums: Dict[str, float] = {}
+        self.count = 0
+        self.lines: List[str] = []
+
+    @staticmethod
+    def launch_timestamp(launch: Dict[str, Any]) -> Optional[float]:
+        """Unix timestamp of a launch, from 'date_utc' (as used by the filters) or else 'date_unix'."""
+        launch_date = parse_launch_date(launch)
+        if launch_date is not None:
+            return launch_date.timestamp()
+        date_unix = launch.get('date_unix')
+        if isinstance(date_unix, (int, float)) and not isinstance(date_unix, bool):
+            return float(date_unix)
+        return None
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        return f"{seconds / 86400:.1f}d"
+
+    def header(self) -> str:
+        return (
+            f"flight | date_utc | success rate (last {self.window}) | "
+            f"gap since previous | launchpad - avg gap (last {self.window})"
+        )
+
+    def process(self, launch: Dict[str, Any]) -> str:
+        """
+        Update the rolling windows with a launch and format its statistics line.
+
+        Args:
+            launch: Launch dictionary
+
+        Returns:
+            Statistics line for this launch
+        """
+        self.count += 1
+
+        # Success rate over the last N launches; unknown outcomes are excluded like in 'report'
+        success = launch.get('success')
+        self.outcomes.append(success)
+        if success is not None:
+            self.window_known += 1
+            self.window_successful += 1 if success else 0
+        if len(self.outcomes) > self.window:
+            dropped = self.outcomes.popleft()
+            if dropped is not None:
+                self.window_known -= 1
+                self.window_successful -= 1 if dropped else 0
+        if self.window_known > 0:
+            success_rate = f"{self.window_successful / self.window_known * 100:.0f}%"
+        else:
+            success_rate = "N/A"
+
+        # Time since the previous launch, over launches in chronological order only
+        timestamp = self.launch_timestamp(launch)
+        if launch.get('upcoming') or (
+            timestamp is not None and self.previous_timestamp is not None and timestamp < self.previous_timestamp
+        ):
+            timestamp = None
+        gap = "N/A"
+        if timestamp is not None:
+            if self.previous_timestamp is not None:
+                gap = self.format_duration(timestamp - self.previous_timestamp)
+            self.previous_timestamp = timestamp
+
+        # Cadence of the launch's pad over its last N gaps
+        launchpad_id = ActionLaunchpads.launchpad_id(launch)
+        cadence = "N/A"
+        if timestamp is not None:
+            last_timestamp = self.pad_last_timestamp.get(launchpad_id)
+            if last_timestamp is not None:
+                gaps = self.pad_gaps.setdefault(launchpad_id, deque())
+                pad_gap = timestamp - last_timestamp
+                gaps.append(pad_gap)
+                self.pad_gap_sums[launchpad_id] = self.pad_gap_sums.get(launchpad_id, 0.0) + pad_gap
+                if len(gaps) > self.window:
+                    self.pad_gap_sums[launchpad_id] -= gaps.popleft()
+                cadence = self.format_duration(self.pad_gap_sums[launchpad_id] / len(gaps))
+            self.pad_last_timestamp[launchpad_id] = timestamp
+
+        flight = launch.get('flight_number', self.count)
+        return (
+            f"{flight} | {launch.get('date_utc', 'N/A')} | {success_rate} | "
+            f"{gap} | {launchpad_id} - {cadence}"
+        )
+
+    def add(self, launch: Dict[str, Any]) -> None:
+        """Process a launch and keep its line for result(); all lines are buffered until then."""
+        self.lines.append(self.process(launch))
+
+    def result(self) -> str:
+        """Format all lines accumulated with add()."""
+        return "\n".join([self.header()] + self.lines)
+
+    @classmethod
+    def execute(cls, data: Iterator[Dict[str, Any]], **options) -> Iterator[str]:
+        """
+        Stream rolling statistics, one line per launch.
+
+        Args:
+            data: Iterator of launch dictionaries, in API (flight number) order
+            **options: Handler options (window)
+
+        Yields:
+            Header line, then one statistics line per launch as it is consumed
+        """
+        logger = logging.getLogger(__name__)
+        logger.debug(f"Executing rolling action with options: {options}")
+
+        # Created eagerly so invalid options fail before output starts
+        handler = cls(**options)
+
+        def stream() -> Iterator[str]:
+            yield handler.header()
+            for launch in data:
+                yield handler.process(launch)
+            logger.debug(f"Rolling stats computed over {handler.count} launches")
+
+        return stream()
@@ -0,0 +1,44 @@
+"""
+Group keys - extract grouping keys from launch records.
+"""
+from typing import Dict, Any, List, Callable
+
+
+def _reference_id(value: Any, *id_fields: str) -> Any:
+    """ID of a reference that may be a plain ID string or an expanded object."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        for field in id_fields:
+            if value.get(field):
+                return value[field]
+    return None
+
+
+def _single(field: str) -> Callable[[Dict[str, Any]], List[str]]:
+    def extract(launch: Dict[str, Any]) -> List[str]:
+        return [_reference_id(launch.get(field), 'id') or 'unknown']
+    return extract
+
+
+def _many(field: str, *id_fields: str) -> Callable[[Dict[str, Any]], List[str]]:
+    def extract(launch: Dict[str, Any]) -> List[str]:
+        values = launch.get(field)
+        if not isinstance(values, list):
+            return []
+        ids = (_reference_id(value, *id_fields) for value in values)
+        return [value_id for value_id in ids if value_id]
+    return extract
+
+
+# Each extractor returns the keys a launch counts towards: exactly one for
+# single-valued fields ('unknown' if missing), zero or more for list fields
+GROUP_KEYS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    'launchpad': _single('launchpad'),
+    'rocket': _single('rocket'),
+    'payloads': _many('payloads', 'id'),
+    'cores': _many('cores', 'core', 'id'),
+    'capsules': _many('capsules', 'id'),
+    'crew': _many('crew', 'crew', 'id'),
+    'ships': _many('ships', 'id'),
+}
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark exact vs approximate (sketch-based) group-by on synthetic launch data.
+
+Generates launches whose payload IDs follow a Zipf distribution over a large
+key space, then reports run time, peak memory of the counting state, top-K
+recall and distinct-count error for both paths.
+
+Usage:
+    python3 benchmarks/bench_groupby.py --launches 1000000 --keys 200000
+"""
+import sys
+import time
+import random
+import argparse
+import itertools
+import tracemalloc
+from pathlib import Path
+from typing import Iterator, Dict, Any, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from actions.ActionGroupBy import ActionGroupBy  # noqa: E402
+
+
+def synthetic_launches(count: int, keys: int, seed: int) -> Iterator[Dict[str, Any]]:
+    """Yield launches with 0-3 payload IDs drawn from a Zipf(1.1) distribution."""
+    rng = random.Random(seed)
+    cum_weights = list(itertools.accumulate(1 / (rank ** 1.1) for rank in range(1, keys + 1)))
+    population = range(keys)
+    for flight in range(count):
+        payloads = rng.choices(population, cum_weights=cum_weights, k=rng.randint(0, 3))
+        yield {'id': f"launch-{flight}", 'payloads': [f"payload-{p}" for p in payloads]}
+
+
+def run(launches: List[Dict[str, Any]], approx: bool, top_k: int) -> tuple:
+    handler = ActionGroupBy(key='payloads', approx=approx, top_k=top_k)
+
+    start = time.perf_counter()
+    for launch in launches:
+        handler.add(launch)
+    elapsed = time.perf_counter() - start
+
+    # Measure the retained counting state separately so tracing does not skew timing
+    tracemalloc.start()
+    measured = ActionGroupBy(key='payloads', approx=approx, top_k=top_k)
+    for launch in launches:
+        measured.add(launch)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if approx:
+        top = [key for key, _, _ in handler.top_keys.top(top_k)]
+        distinct = handler.distinct_keys.count()
+    else:
+        top = [key for key, _ in handler.counts.most_common(top_k)]
+        distinct = len(handler.counts)
+    return elapsed, peak, top, distinct
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark exact vs approximate group-by')
+    parser.add_argument('--launches', type=int, default=200000, help='Number of synthetic launches')
+    parser.add_argument('--keys', type=int, default=100000, help='Size of the payload ID key space')
+    parser.add_argument('--top-k', type=int, default=10, help='Number of top keys to compare')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    launches = list(synthetic_launches(args.launches, args.keys, args.seed))
+
+    exact_time, exact_peak, exact_top, exact_distinct = run(launches, False, args.top_k)
+    approx_time, approx_peak, approx_top, approx_distinct = run(launches, True, args.top_k)
+
+    recall = len(set(exact_top) & set(approx_top)) / len(exact_top) if exact_top else 1.0
+    distinct_error = abs(approx_distinct - exact_distinct) / exact_distinct if exact_distinct else 0.0
+
+    print(f"launches: {args.launches}, key space: {args.keys}, top-k: {args.top_k}")
+    print(f"exact  - time: {exact_time:.2f}s | state peak: {exact_peak / 1024:.0f} KiB | distinct: {exact_distinct}")
+    print(f"approx - time: {approx_time:.2f}s | state peak: {approx_peak / 1024:.0f} KiB | distinct: ~{approx_distinct}")
+    print(f"top-{args.top_k} recall: {recall:.0%} | distinct count error: {distinct_error:.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rolling action on synthetic launch histories of increasing size.
+
+Streams synthetic launches through ActionRolling and reports throughput per
+size, which should stay flat if the pass is linear.
+
+Usage:
+    python3 benchmarks/bench_rolling.py --sizes 250000 500000 1000000 2000000
+"""
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Iterator, Dict, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from actions.ActionRolling import ActionRolling  # noqa: E402
+
+
+def synthetic_launches(count: int, launchpads: int, seed: int) -> Iterator[Dict[str, Any]]:
+    """Yield chronologically ordered launches a few hours apart from random pads."""
+    rng = random.Random(seed)
+    date = datetime(2006, 1, 1, tzinfo=timezone.utc)
+    outcomes = (True, True, True, True, False, None)
+    for flight in range(1, count + 1):
+        date += timedelta(minutes=rng.randint(30, 600))
+        yield {
+            'flight_number': flight,
+            'date_utc': date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'success': rng.choice(outcomes),
+            'launchpad': f"pad-{rng.randrange(launchpads)}",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the rolling action')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 200000, 400000], help='Launch counts')
+    parser.add_argument('--window', type=int, default=10, help='Rolling window size')
+    parser.add_argument('--launchpads', type=int, default=50, help='Number of distinct launchpads')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        launches = list(synthetic_launches(size, args.launchpads, args.seed))
+        start = time.perf_counter()
+        lines = 0
+        for _ in ActionRolling.execute(iter(launches), window=args.window):
+            lines += 1
+        elapsed = time.perf_counter() - start
+        print(f"launches: {size:>9} | time: {elapsed:6.2f}s | {size / elapsed / 1000:6.0f}k launches/s")
+
+
+if __name__ == '__main__':
+    main()
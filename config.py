@@ -7,3 +7,19 @@ API_TIMEOUT = 15
 API_ALLOWED_RETRY_COUNT = 1
 API_RETRY_ALLOWED_ON_TIMEOUT = True
 API_RETRY_ALLOWED_ON_HTTP_CODES = [503]
+API_MAX_CONNECTIONS = 10
+
+# Approximate Group-By Configuration
+APPROX_TOP_K = 10
+APPROX_TOP_K_CAPACITY = 1000
+APPROX_HLL_PRECISION = 14
+
+# Rolling Statistics Configuration
+ROLLING_WINDOW = 10
+
+# Watch Mode Configuration
+WATCH_INTERVAL = 60
+
+# Snapshot History Configuration
+SNAPSHOT_MAX_DELTAS = 50
+SNAPSHOT_RETENTION_DAYS = 30
@@ -0,0 +1,169 @@
+"""
+Aggregate Cube of launch counts and payload sums, persisted next to the cache.
+"""
+import json
+import os
+import logging
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Callable
+from filters.LaunchDate import parse_launch_date
+from actions.ActionLaunchpads import ActionLaunchpads
+from actions.ActionPayloads import ActionPayloads
+
+
+# Cell: (year, month, launchpad, success, launch count, payload sum);
+# year and month are None for launches with a missing or invalid date
+Cell = Tuple[Optional[int], Optional[int], str, Optional[bool], int, int]
+
+
+class AggregateCube:
+    """
+    Launch counts and payload sums over (year, month, launchpad, success).
+
+    Built from the full launch list whenever the cache is refreshed and saved
+    as '<cache stem>_cube.json'. Like the partition manifest, it records the
+    cache file's size and mtime and is ignored once they no longer match.
+    Filters listed in CELL_FILTERS can be answered by rolling up cells instead
+    of scanning launches; anything else falls back to the scan path.
+    """
+
+    # Cell-level equivalents of FilterRegistry filters, keyed by filter name
+    CELL_FILTERS: Dict[str, Callable[..., Callable[[Cell], bool]]] = {
+        'by_year': lambda year: lambda cell: cell[0] == year,
+        'by_year_and_status': lambda year, status=None: lambda cell: (
+            cell[0] == year and (status is None or cell[3] == status)
+        ),
+    }
+
+    def __init__(self, cache_path: str):
+        cache_path = Path(cache_path)
+        self.cache_path = cache_path
+        self.cube_path = cache_path.parent / f"{cache_path.stem}_cube.json"
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def build_cells(data: List[Dict[str, Any]]) -> List[Cell]:
+        """
+        Aggregate launches into cube cells.
+
+        Args:
+            data: Full launch list
+
+        Returns:
+            List of cells
+        """
+        cells: Dict[Tuple, List[int]] = {}
+        for launch in data:
+            launch_date = parse_launch_date(launch)
+            success = launch.get('success')
+            key = (
+                launch_date.year if launch_date else None,
+                launch_date.month if launch_date else None,
+                ActionLaunchpads.launchpad_id(launch),
+                None if success is None else bool(success),
+            )
+            totals = cells.setdefault(key, [0, 0])
+            totals[0] += 1
+            totals[1] += ActionPayloads.payload_count(launch)
+        return [key + (count, payloads) for key, (count, payloads) in cells.items()]
+
+    def _source_stamp(self) -> Dict[str, int]:
+        stat = self.cache_path.stat()
+        return {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns}
+
+    def save(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        Build the cube for data and persist it, stamped with the current cache file.
+
+        Args:
+            data: Launch list that was just saved to the cache file
+
+        Returns:
+            True if saved successfully
+        """
+        try:
+            cells = self.build_cells(data)
+            self.logger.debug(f"Saving aggregate cube with {len(cells)} cells: {self.cube_path}")
+            cube = self._source_stamp()
+            cube['cells'] = cells
+            tmp_path = self.cube_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cube, f)
+            os.replace(tmp_path, self.cube_path)
+            return True
+        except (IOError, OSError) as e:
+            self.logger.debug(f"Error saving aggregate cube: {e}")
+            return False
+
+    def load(self) -> Optional[List[Cell]]:
+        """
+        Load cube cells if the cube matches the current cache file.
+
+        Returns:
+            List of cells, or None if missing or stale
+        """
+        if not self.cube_path.exists() or not self.cache_path.exists():
+            return None
+
+        try:
+            with open(self.cube_path, 'r', encoding='utf-8') as f:
+                cube = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.debug(f"Error loading aggregate cube: {e}")
+            return None
+
+        stamp = self._source_stamp()
+        if any(cube.get(key) != value for key, value in stamp.items()):
+            self.logger.debug("Aggregate cube is stale, ignoring it")
+            return None
+        return [tuple(cell) for cell in cube['cells']]
+
+    def exists(self) -> bool:
+        return self.load() is not None
+
+    @classmethod
+    def cell_predicate(cls, filters: List[Tuple[str, Dict[str, Any]]]) -> Optional[Callable[[Cell], bool]]:
+        """
+        Translate a chain of filters into a single cell predicate.
+
+        Args:
+            filters: List of (filter name, filter kwargs) in application order
+
+        Returns:
+            Cell predicate, or None if any filter cannot be answered from cells
+        """
+        predicates = []
+        for filter_name, kwargs in filters:
+            if filter_name not in cls.CELL_FILTERS:
+                return None
+            try:
+                predicates.append(cls.CELL_FILTERS[filter_name](**kwargs))
+            except TypeError:
+                return None
+        return lambda cell: all(predicate(cell) for predicate in predicates)
+
+    def matching_cells(
+        self,
+        filters: List[Tuple[str, Dict[str, Any]]],
+        cells: Optional[List[Cell]] = None
+    ) -> Optional[List[Cell]]:
+        """
+        Get the cells selected by a chain of filters.
+
+        Args:
+            filters: List of (filter name, filter kwargs) in application order
+            cells: Cells already returned by load(), loaded if not given
+
+        Returns:
+            Matching cells, or None if the cube is unavailable or cannot serve the filters
+        """
+        predicate = self.cell_predicate(filters)
+        if predicate is None:
+            self.logger.debug(f"Aggregate cube cannot serve filters: {filters}")
+            return None
+
+        if cells is None:
+            cells = self.load()
+        if cells is None:
+            return None
+        return [cell for cell in cells if predicate(cell)]
@@ -0,0 +1,243 @@
+"""
+Async API Caller streaming JSON records over a pooled HTTP/1.1 connection.
+"""
+import ssl
+import asyncio
+import logging
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
+from urllib.parse import urlsplit
+from .JsonArrayStream import JsonArrayStream
+from .LaunchDataError import LaunchDataError
+
+
+class _RetryableError(Exception):
+    """Failure before any record was yielded, eligible for retry."""
+
+    def __init__(self, error_code: int, error_message: str, status_code: Optional[int] = None):
+        super().__init__(error_message)
+        self.error_code = error_code
+        self.error_message = error_message
+        self.status_code = status_code
+
+
+class AsyncApiCaller:
+    """
+    Streams a JSON array response as records, with retry logic and a shared connection pool.
+
+    Connections are kept alive and reused across requests, and at most
+    max_connections are open at once, so many concurrent pipelines on one event
+    loop share the pool. Only the standard library is used.
+    """
+
+    CHUNK_SIZE = 16384
+
+    def __init__(
+        self,
+        timeout: int = 15,
+        allowed_retry_count: int = 1,
+        retry_allowed_on_timeout: bool = True,
+        retry_allowed_on_http_codes: list[int] = None,
+        retry_delay: float = 1.0,
+        exponential_backoff: bool = False,
+        max_connections: int = 10
+    ):
+        """
+        Initialize async API caller.
+
+        Args:
+            timeout: Timeout in seconds for connecting and for each read
+            allowed_retry_count: Maximum number of retries
+            retry_allowed_on_timeout: Whether to retry on timeout
+            retry_allowed_on_http_codes: List of HTTP status codes that allow retry (e.g., [404, 503])
+            retry_delay: Initial delay between retries in seconds
+            exponential_backoff: Use exponential backoff for retries
+            max_connections: Maximum number of open connections in the pool
+        """
+        self.timeout = timeout
+        self.allowed_retry_count = allowed_retry_count
+        self.retry_allowed_on_timeout = retry_allowed_on_timeout
+        self.retry_allowed_on_http_codes = retry_allowed_on_http_codes or []
+        self.retry_delay = retry_delay
+        self.exponential_backoff = exponential_backoff
+        self.max_connections = max_connections
+        self.logger = logging.getLogger(__name__)
+        self._idle: Dict[Tuple[str, int, bool], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    async def stream(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch a JSON array from URL, yielding each record as soon as it is parsed.
+
+        Retries are only attempted before the first record has been yielded.
+
+        Yields:
+            Launch dictionaries
+
+        Raises:
+            LaunchDataError: 1 for timeout, 2 for non-200 response, 3 for unexpected error
+        """
+        attempt = 0
+        delay = self.retry_delay
+
+        while True:
+            if attempt > 0:
+                self.logger.debug(f"Retry attempt {attempt} for URL: {url}")
+
+            yielded = False
+            try:
+                async for record in self._request(url):
+                    yielded = True
+                    yield record
+                return
+            except _RetryableError as e:
+                retry_allowed = (
+                    e.status_code in self.retry_allowed_on_http_codes
+                    if e.status_code is not None
+                    else self.retry_allowed_on_timeout
+                )
+                if yielded or not retry_allowed or attempt >= self.allowed_retry_count:
+                    raise LaunchDataError(e.error_code, e.error_message)
+            except (TimeoutError, asyncio.TimeoutError) as e:
+                self.logger.debug(f"HTTP timeout after {self.timeout} seconds")
+                if yielded or not self.retry_allowed_on_timeout or attempt >= self.allowed_retry_count:
+                    raise LaunchDataError(1, f"Request timeout: {str(e)}")
+            except OSError as e:
+                self.logger.debug(f"URL error: {str(e)}")
+                if yielded or not self.retry_allowed_on_timeout or attempt >= self.allowed_retry_count:
+                    raise LaunchDataError(1, f"URL error: {str(e)}")
+            except LaunchDataError:
+                raise
+            except Exception as e:
+                self.logger.debug(f"Unexpected error: {str(e)}")
+                raise LaunchDataError(3, f"Unexpected error: {str(e)}")
+
+            attempt += 1
+            if self.exponential_backoff:
+                delay *= 2
+            await asyncio.sleep(delay)
+
+    async def _request(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        parts = urlsplit(url)
+        secure = parts.scheme == 'https'
+        host = parts.hostname
+        port = parts.port or (443 if secure else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path += f"?{parts.query}"
+        key = (host, port, secure)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+
+        async with self._semaphore:
+            reader, writer, reused = await self._acquire(key)
+            reusable = False
+            try:
+                request = (
+                    f"GET {path} HTTP/1.1\r\n"
+                    f"Host: {host}\r\n"
+                    f"Accept: application/json\r\n"
+                    f"Connection: keep-alive\r\n\r\n"
+                )
+                writer.write(request.encode('ascii'))
+                await asyncio.wait_for(writer.drain(), self.timeout)
+
+                status_line = await asyncio.wait_for(reader.readline(), self.timeout)
+                if not status_line and reused:
+                    # Idle connection was closed by the server; retry once on a fresh one
+                    writer.close()
+                    reader, writer, _ = await self._acquire(key, fresh=True)
+                    writer.write(request.encode('ascii'))
+                    await asyncio.wait_for(writer.drain(), self.timeout)
+                    status_line = await asyncio.wait_for(reader.readline(), self.timeout)
+
+                status_code = int(status_line.split()[1])
+                headers = await self._read_headers(reader)
+
+                if status_code != 200:
+                    self.logger.debug(f"HTTP status code: {status_code}")
+                    raise _RetryableError(2, f"Non-200 HTTP response: {status_code}", status_code)
+
+                parser = JsonArrayStream()
+                async for chunk in self._read_body(reader, headers):
+                    for record in parser.feed(chunk):
+                        yield record
+                parser.close()
+
+                reusable = 'content-length' in headers or headers.get('transfer-encoding') == 'chunked'
+                reusable = reusable and headers.get('connection', '').lower() != 'close'
+            finally:
+                if reusable:
+                    self._idle.setdefault(key, []).append((reader, writer))
+                else:
+                    writer.close()
+
+    async def _acquire(
+        self,
+        key: Tuple[str, int, bool],
+        fresh: bool = False
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        idle = self._idle.get(key)
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.logger.debug(f"Reusing pooled connection to {key[0]}:{key[1]}")
+                return reader, writer, True
+            writer.close()
+
+        host, port, secure = key
+        ssl_context = None
+        if secure:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        self.logger.debug(f"Opening connection to {host}:{port}")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context),
+            self.timeout
+        )
+        return reader, writer, False
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> Dict[str, str]:
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), self.timeout)
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await asyncio.wait_for(reader.readline(), self.timeout)
+                size = int(size_line.split(b';')[0].strip(), 16)
+                if size == 0:
+                    # Skip trailers up to the terminating blank line
+                    await self._read_headers(reader)
+                    return
+                yield await asyncio.wait_for(reader.readexactly(size), self.timeout)
+                await asyncio.wait_for(reader.readexactly(2), self.timeout)
+        elif 'content-length' in headers:
+            remaining = int(headers['content-length'])
+            while remaining > 0:
+                chunk = await asyncio.wait_for(reader.read(min(remaining, self.CHUNK_SIZE)), self.timeout)
+                if not chunk:
+                    raise ConnectionError("Connection closed before end of response")
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            while True:
+                chunk = await asyncio.wait_for(reader.read(self.CHUNK_SIZE), self.timeout)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def close(self) -> None:
+        """Close all idle pooled connections."""
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
@@ -0,0 +1,181 @@
+"""
+Async Launch Data Access layer - streams launch data from cache or API, shared across pipelines.
+"""
+import asyncio
+import logging
+from typing import Dict, Any, AsyncIterator, Optional, List, Callable, Set
+from .AsyncApiCaller import AsyncApiCaller
+from .CacheManager import CacheManager
+from .SnapshotStore import SnapshotStore
+from .AggregateCube import AggregateCube
+from .LaunchDataAccess import persist_fetched_data
+import config
+
+
+class _SharedFetch:
+    """One in-flight API fetch whose records are fanned out to any number of readers."""
+
+    def __init__(
+        self,
+        source: AsyncIterator[Dict[str, Any]],
+        on_done: Callable[['_SharedFetch'], None]
+    ):
+        self.records: List[Dict[str, Any]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._on_done = on_done
+        self._changed = asyncio.Condition()
+        self.task = asyncio.ensure_future(self._run(source))
+
+    async def _run(self, source: AsyncIterator[Dict[str, Any]]) -> None:
+        try:
+            async for record in source:
+                self.records.append(record)
+                async with self._changed:
+                    self._changed.notify_all()
+        except BaseException as e:
+            self.error = e
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            self.done = True
+            self._on_done(self)
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[Dict[str, Any]]:
+        index = 0
+        while True:
+            while index < len(self.records):
+                yield self.records[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            async with self._changed:
+                await self._changed.wait_for(lambda: index < len(self.records) or self.done)
+
+
+class AsyncLaunchDataAccess:
+    """
+    Streams launch data from cache or API for async pipelines.
+
+    A single instance is meant to be shared by all pipelines on an event loop:
+    the cache file is loaded at most once, concurrent API fetches are coalesced
+    into one request whose records are delivered to every reader as they arrive,
+    and all requests go through one connection pool.
+    """
+
+    # Records yielded between explicit yields to the event loop on the in-memory path
+    YIELD_EVERY = 1000
+
+    def __init__(self, cache_path: str):
+        """
+        Initialize async launch data access.
+
+        Args:
+            cache_path: Path to cache file
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_manager = CacheManager(cache_path)
+        self.aggregate_cube = AggregateCube(cache_path)
+        self.snapshot_store = SnapshotStore(
+            cache_path,
+            max_deltas=config.SNAPSHOT_MAX_DELTAS,
+            retention_days=config.SNAPSHOT_RETENTION_DAYS
+        )
+        self.api_caller = AsyncApiCaller(
+            timeout=config.API_TIMEOUT,
+            allowed_retry_count=config.API_ALLOWED_RETRY_COUNT,
+            retry_allowed_on_timeout=config.API_RETRY_ALLOWED_ON_TIMEOUT,
+            retry_allowed_on_http_codes=config.API_RETRY_ALLOWED_ON_HTTP_CODES,
+            max_connections=config.API_MAX_CONNECTIONS
+        )
+        self.api_url = config.API_URL
+        self._records: Optional[List[Dict[str, Any]]] = None
+        self._inflight: Optional[_SharedFetch] = None
+        self._cache_lock: Optional[asyncio.Lock] = None
+        self._save_lock: Optional[asyncio.Lock] = None
+        self._save_tasks: Set[asyncio.Future] = set()
+
+    async def __aenter__(self) -> 'AsyncLaunchDataAccess':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for all pending cache saves and close pooled connections."""
+        while self._save_tasks:
+            await asyncio.gather(*self._save_tasks)
+        await self.api_caller.close()
+
+    async def fetch(self, refresh: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch launch data from cache if file exists and refresh is false, else stream from API.
+
+        Args:
+            refresh: If True, bypass cache and fetch from API
+
+        Yields:
+            Launch dictionaries, as soon as they are available
+
+        Raises:
+            LaunchDataError: If the API fetch fails
+        """
+        if not refresh:
+            records = await self._load_cached()
+            if records is not None:
+                for index, record in enumerate(records, 1):
+                    yield record
+                    if index % self.YIELD_EVERY == 0:
+                        await asyncio.sleep(0)
+                return
+        else:
+            self.logger.debug("Refresh requested, fetching from API")
+
+        if self._inflight is None:
+            self.logger.debug(f"Streaming data from API: {self.api_url}")
+            self._inflight = _SharedFetch(self.api_caller.stream(self.api_url), self._on_fetch_done)
+        else:
+            self.logger.debug("Joining in-flight API fetch")
+
+        async for record in self._inflight.subscribe():
+            yield record
+
+    async def _load_cached(self) -> Optional[List[Dict[str, Any]]]:
+        if self._records is not None:
+            return self._records
+
+        if self._cache_lock is None:
+            self._cache_lock = asyncio.Lock()
+        async with self._cache_lock:
+            if self._records is None and self.cache_manager.is_valid():
+                self.logger.debug("Cache is valid, attempting to load from cache")
+                self._records = await asyncio.to_thread(self.cache_manager.load)
+        return self._records
+
+    def _on_fetch_done(self, shared: _SharedFetch) -> None:
+        # Later fetches must start a new request rather than join a finished one
+        if self._inflight is shared:
+            self._inflight = None
+        if shared.error is not None or not shared.records:
+            return
+
+        self.logger.debug(f"Fetched {len(shared.records)} items from API")
+        self._records = shared.records
+        save_task = asyncio.ensure_future(self._save(shared.records))
+        self._save_tasks.add(save_task)
+        save_task.add_done_callback(self._save_tasks.discard)
+
+    async def _save(self, data: List[Dict[str, Any]]) -> None:
+        # Saves run one at a time, in fetch order, so the cache files are never
+        # rewritten concurrently and each snapshot delta is diffed against the last
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        async with self._save_lock:
+            await asyncio.to_thread(
+                persist_fetched_data,
+                self.cache_manager, self.aggregate_cube, self.snapshot_store, data, self.logger
+            )
@@ -3,17 +3,31 @@ Cache Manager for storing and retrieving JSON data from files.
 """
 import json
 import os
+import shutil
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+from filters.LaunchDate import parse_launch_date
 
 
 class CacheManager:
-    """Manages file-based caching for JSON data."""
+    """
+    Manages file-based caching for JSON data.
+    
+    Besides the single cache file, save() writes a year-partitioned copy next to
+    it (for 'launches.json': 'launches/year=2022/part.json', with undated launches
+    under 'year=unknown') and a 'launches/manifest.json' with per-partition stats.
+    The manifest records the cache file's size and mtime, so partitions are only
+    used while they still match the cache file they were written with.
+    """
+    
+    UNKNOWN_PARTITION = 'unknown'
     
     def __init__(self, cache_path: str):
         self.cache_path = Path(cache_path)
         self.cache_dir = self.cache_path.parent
+        self.partition_dir = self.cache_dir / self.cache_path.stem
+        self.manifest_path = self.partition_dir / 'manifest.json'
         self.logger = logging.getLogger(__name__)
     
     def exists(self) -> bool:
@@ -46,17 +60,154 @@ class CacheManager:
             with open(self.cache_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
             self.logger.debug("Cache saved successfully")
-            return True
         except IOError as e:
             self.logger.debug(f"Error saving cache: {e}")
             return False
+        
+        # Partitions are an optimization; the single cache file stays authoritative
+        try:
+            self.save_partitions(data)
+        except (IOError, OSError) as e:
+            self.logger.debug(f"Error saving cache partitions: {e}")
+        return True
     
-    def clear(self) -> bool:        
-        if not self.exists():
-            return True
+    def _source_stamp(self) -> Dict[str, int]:
+        stat = self.cache_path.stat()
+        return {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns}
+    
+    def save_partitions(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Write the year-partitioned layout and manifest for the given data.
+        
+        Args:
+            data: Launch list that was just saved to the cache file
+        """
+        partitions: Dict[str, List[Dict[str, Any]]] = {}
+        stats: Dict[str, Dict[str, Any]] = {}
+        date_bounds: Dict[str, list] = {}
+        
+        for launch in data:
+            launch_date = parse_launch_date(launch)
+            year = str(launch_date.year) if launch_date else self.UNKNOWN_PARTITION
+            partitions.setdefault(year, []).append(launch)
+            
+            partition_stats = stats.setdefault(year, {
+                'path': f"year={year}/part.json",
+                'count': 0,
+                'min_date': None,
+                'max_date': None,
+                'successful': 0,
+                'failed': 0,
+                'unknown': 0,
+            })
+            partition_stats['count'] += 1
+            if launch_date:
+                bounds = date_bounds.setdefault(year, [launch_date, launch_date])
+                if launch_date <= bounds[0]:
+                    bounds[0] = launch_date
+                    partition_stats['min_date'] = launch['date_utc']
+                if launch_date >= bounds[1]:
+                    bounds[1] = launch_date
+                    partition_stats['max_date'] = launch['date_utc']
+            
+            success = launch.get('success')
+            if success is None:
+                partition_stats['unknown'] += 1
+            elif success:
+                partition_stats['successful'] += 1
+            else:
+                partition_stats['failed'] += 1
+        
+        self.logger.debug(f"Saving {len(partitions)} cache partitions to: {self.partition_dir}")
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Drop the manifest first so a partial write is never mistaken for a valid layout
+        if self.manifest_path.exists():
+            self.manifest_path.unlink()
+        
+        for existing in self.partition_dir.glob('year=*'):
+            if existing.is_dir() and existing.name[len('year='):] not in partitions:
+                shutil.rmtree(existing)
+        
+        for year, launches in partitions.items():
+            part_path = self.partition_dir / stats[year]['path']
+            part_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(part_path, 'w', encoding='utf-8') as f:
+                json.dump(launches, f, indent=2)
+        
+        manifest = self._source_stamp()
+        manifest['partitions'] = stats
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+    
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the partition manifest if it matches the current cache file.
+        
+        Returns:
+            Manifest dictionary, or None if missing or stale
+        """
+        if not self.exists() or not self.manifest_path.exists():
+            return None
+        
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.debug(f"Error loading cache manifest: {e}")
+            return None
+        
+        stamp = self._source_stamp()
+        if any(manifest.get(key) != value for key, value in stamp.items()):
+            self.logger.debug("Cache manifest is stale, ignoring partitions")
+            return None
+        return manifest
+    
+    def has_partitions(self) -> bool:
+        return self.load_manifest() is not None
+    
+    def load_partition(
+        self,
+        year: int,
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the launches of a single year partition.
+        
+        Args:
+            year: Partition year
+            manifest: Manifest already returned by load_manifest(), loaded if not given
         
+        Returns:
+            List of launches (empty if the year has none), or None if partitions are unavailable
+        """
+        if manifest is None:
+            manifest = self.load_manifest()
+        if manifest is None:
+            return None
+        
+        partition_stats = manifest['partitions'].get(str(year))
+        if partition_stats is None:
+            self.logger.debug(f"No cache partition for year {year}")
+            return []
+        
+        part_path = self.partition_dir / partition_stats['path']
+        try:
+            self.logger.debug(f"Loading cache partition from: {part_path}")
+            with open(part_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                self.logger.debug(f"Loaded {len(data)} items from cache partition")
+                return data
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.debug(f"Error loading cache partition: {e}")
+            return None
+    
+    def clear(self) -> bool:        
         try:
-            self.cache_path.unlink()
+            if self.exists():
+                self.cache_path.unlink()
+            if self.partition_dir.exists():
+                shutil.rmtree(self.partition_dir)
             return True
         except IOError:
             return False
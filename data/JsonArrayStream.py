@@ -0,0 +1,113 @@
+"""
+Incremental parser for a JSON array of objects arriving in chunks.
+"""
+import re
+import json
+import codecs
+from typing import List, Dict, Any
+
+
+class JsonArrayStream:
+    """
+    Parses a top-level JSON array of objects incrementally.
+
+    Each feed() returns the elements completed by that chunk, so records can be
+    processed while the rest of the response is still in flight. Only object
+    and array elements are supported, which is what the launches API returns.
+    """
+
+    _OUTSIDE_STRING = re.compile(r'[\[\]{}"]')
+    _INSIDE_STRING = re.compile(r'["\\]')
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._element_start = None
+        self._started = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """
+        Feed the next chunk of the response body.
+
+        Args:
+            chunk: Raw bytes (may split UTF-8 sequences and JSON tokens anywhere)
+
+        Returns:
+            List of elements completed by this chunk
+
+        Raises:
+            ValueError: If the data is not a JSON array
+        """
+        self._buffer += self._decoder.decode(chunk)
+        elements = []
+        buffer = self._buffer
+        pos = self._pos
+
+        while not self.done:
+            if self._in_string:
+                match = self._INSIDE_STRING.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == '\\':
+                    if match.end() >= len(buffer):
+                        # Escaped character not received yet
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            if not self._started:
+                stripped = buffer[pos:].lstrip()
+                if not stripped:
+                    pos = len(buffer)
+                    break
+                if stripped[0] != '[':
+                    raise ValueError("Expected a JSON array")
+
+            match = self._OUTSIDE_STRING.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in '[{':
+                if self._depth == 1:
+                    self._element_start = match.start()
+                self._depth += 1
+                self._started = True
+            else:
+                self._depth -= 1
+                if self._depth == 1 and self._element_start is not None:
+                    elements.append(json.loads(buffer[self._element_start:pos]))
+                    self._element_start = None
+                elif self._depth == 0:
+                    self.done = True
+
+        # Drop text that no pending element needs any more
+        keep_from = self._element_start if self._element_start is not None else pos
+        self._buffer = buffer[keep_from:]
+        self._pos = pos - keep_from
+        if self._element_start is not None:
+            self._element_start = 0
+        return elements
+
+    def close(self) -> None:
+        """
+        Check that the array was complete.
+
+        Raises:
+            ValueError: If the data ended before the array was closed
+        """
+        if not self.done:
+            raise ValueError("Incomplete JSON array")
@@ -2,12 +2,48 @@
 Launch Data Access layer - orchestrates data fetching from cache or API.
 """
 import logging
-from typing import Iterator, Dict, Any, Callable, Optional
+from datetime import datetime
+from typing import Iterator, Dict, Any, Callable, Optional, List, Tuple
 from .ApiCaller import ApiCaller
 from .CacheManager import CacheManager
+from .SnapshotStore import SnapshotStore
+from .AggregateCube import AggregateCube, Cell
 import config
 
 
+def persist_fetched_data(
+    cache_manager: CacheManager,
+    aggregate_cube: AggregateCube,
+    snapshot_store: SnapshotStore,
+    data: List[Dict[str, Any]],
+    logger: logging.Logger
+) -> None:
+    """
+    Save freshly fetched data to the cache, its partitions, aggregate cube and snapshot history.
+    
+    Shared by the sync and async data access layers. Failures are logged and
+    never stop execution.
+    
+    Args:
+        cache_manager: Cache (and partition) writer
+        aggregate_cube: Aggregate cube for the cache
+        snapshot_store: Snapshot history for the cache
+        data: Full launch list as returned by the API
+        logger: Logger to report failures to
+    """
+    try:
+        if cache_manager.save(data):
+            aggregate_cube.save(data)
+    except Exception:
+        # Cache save failure should not stop execution
+        logger.debug("Cache save failed, continuing without cache")
+    try:
+        snapshot_store.record(data)
+    except Exception as e:
+        # Snapshot failure should not stop execution either
+        logger.debug(f"Snapshot record failed: {e}")
+
+
 class LaunchDataAccess:
     """Orchestrates data fetching from cache or API."""
     
@@ -20,6 +56,12 @@ class LaunchDataAccess:
         """
         self.logger = logging.getLogger(__name__)
         self.cache_manager = CacheManager(cache_path)
+        self.aggregate_cube = AggregateCube(cache_path)
+        self.snapshot_store = SnapshotStore(
+            cache_path,
+            max_deltas=config.SNAPSHOT_MAX_DELTAS,
+            retention_days=config.SNAPSHOT_RETENTION_DAYS
+        )
         self.api_caller = ApiCaller(
             timeout=config.API_TIMEOUT,
             allowed_retry_count=config.API_ALLOWED_RETRY_COUNT,
@@ -31,7 +73,8 @@ class LaunchDataAccess:
     def fetch(
         self,
         refresh: bool,
-        onError: Callable[[int, str], None]
+        onError: Callable[[int, str], None],
+        as_of: Optional[datetime] = None
     ) -> Optional[Iterator[Dict[str, Any]]]:
         """
         Fetch launch data from cache if file exists and refresh is false, else call API.  
@@ -39,10 +82,19 @@ class LaunchDataAccess:
         Args:
             refresh: If True, bypass cache and fetch from API
             onError: Callback function called with (error_code, error_message) on error (required)
+            as_of: If set, rebuild the data as it was at this time from snapshot history
         
         Returns:
             Iterator of launch dictionaries if successful, None if error occurred
         """
+        if as_of is not None:
+            self.logger.debug(f"Loading snapshot history as of {as_of.isoformat()}")
+            snapshot_data = self.snapshot_store.load_as_of(as_of)
+            if snapshot_data is None:
+                onError(4, f"No snapshot history as of {as_of.isoformat()}")
+                return None
+            return iter(snapshot_data)
+        
         # Try cache first if not refreshing
         if self.cache_manager.is_valid(refresh):
             self.logger.debug("Cache is valid, attempting to load from cache")
@@ -69,11 +121,7 @@ class LaunchDataAccess:
         # Save to cache (continue even if save fails)
         if data:
             self.logger.debug(f"Fetched {len(data)} items from API")
-            try:
-                self.cache_manager.save(data)
-            except Exception:
-                # Cache save failure should not stop execution
-                self.logger.debug("Cache save failed, continuing without cache")
+            self.persist(data)
         
         # Return as iterator
         def api_iterator():
@@ -81,3 +129,88 @@ class LaunchDataAccess:
                 yield item
         
         return api_iterator()
+    
+    def persist(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Save freshly fetched data to the cache, its partitions, aggregate cube and snapshot history.
+        
+        Args:
+            data: Full launch list as returned by the API
+        """
+        persist_fetched_data(self.cache_manager, self.aggregate_cube, self.snapshot_store, data, self.logger)
+    
+    def has_partitions(self) -> bool:
+        """Whether the cache has an up-to-date year-partitioned layout."""
+        return self.cache_manager.has_partitions()
+    
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """Load the partition manifest, or None if missing or stale."""
+        return self.cache_manager.load_manifest()
+    
+    def fetch_partition(
+        self,
+        year: int,
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Fetch launch data for a single year from the partitioned cache.
+        
+        Args:
+            year: Year to load
+            manifest: Manifest already returned by load_manifest(), loaded if not given
+        
+        Returns:
+            Iterator of launch dictionaries, or None if partitions are unavailable
+        """
+        partition_data = self.cache_manager.load_partition(year, manifest)
+        if partition_data is None:
+            return None
+        return iter(partition_data)
+    
+    def partition_stats(
+        self,
+        year: int,
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get manifest stats for a single year partition.
+        
+        Args:
+            year: Partition year
+            manifest: Manifest already returned by load_manifest(), loaded if not given
+        
+        Returns:
+            Stats dictionary (count, min/max date, success counts), or None if unavailable
+        """
+        if manifest is None:
+            manifest = self.cache_manager.load_manifest()
+        if manifest is None:
+            return None
+        return manifest['partitions'].get(str(year), {
+            'count': 0, 'successful': 0, 'failed': 0, 'unknown': 0
+        })
+    
+    def has_cube(self) -> bool:
+        """Whether an aggregate cube matching the current cache exists."""
+        return self.aggregate_cube.exists()
+    
+    def load_cube(self) -> Optional[List[Cell]]:
+        """Load all aggregate cube cells, or None if the cube is missing or stale."""
+        return self.aggregate_cube.load()
+    
+    def cube_cells(
+        self,
+        filters: List[Tuple[str, Dict[str, Any]]],
+        cells: Optional[List[Cell]] = None
+    ) -> Optional[List[Cell]]:
+        """
+        Get aggregate cube cells selected by a chain of filters.
+        
+        Args:
+            filters: List of (filter name, filter kwargs) in application order
+            cells: Cells already returned by load_cube(), loaded if not given
+        
+        Returns:
+            Matching cells, or None if the cube is unavailable or cannot serve the filters
+        """
+        return self.aggregate_cube.matching_cells(filters, cells)
@@ -0,0 +1,19 @@
+"""
+Exception raised by the async data layer in place of error callbacks.
+"""
+
+
+class LaunchDataError(Exception):
+    """Launch data could not be fetched; carries the CLI exit code semantics."""
+    
+    def __init__(self, error_code: int, error_message: str):
+        """
+        Initialize launch data error.
+        
+        Args:
+            error_code: 1 for timeout, 2 for non-200 response, 3 for unexpected error
+            error_message: Error description
+        """
+        super().__init__(f"Error {error_code}: {error_message}")
+        self.error_code = error_code
+        self.error_message = error_message
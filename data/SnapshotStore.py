@@ -0,0 +1,271 @@
+"""
+Snapshot Store for keeping a delta-encoded history of cached launch data.
+"""
+import json
+import os
+import logging
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator
+
+
+class SnapshotStore:
+    """
+    Keeps one base snapshot plus one delta per refresh, keyed by launch 'id'.
+
+    Layout under the cache directory (for cache file 'launches.json'):
+        launches_snapshots/base.json     {"timestamp": ..., "launches": [...]}
+        launches_snapshots/deltas.jsonl  one {"timestamp", "added", "changed", "removed"} per line
+        launches_snapshots/latest.json   {"deltas_size": ..., "delta_count": ..., "launches": [...]}
+
+    Changed launches store only the fields that were set or unset, and refreshes
+    that change nothing write no delta, so storage grows with the rate of change
+    rather than with the number of refreshes. 'latest.json' holds the state after
+    the last delta, so record() diffs against it instead of replaying the history;
+    it is only trusted while 'deltas_size' matches the deltas file, and rebuilt by
+    replay otherwise. Launches without an 'id' cannot be tracked and are left out
+    of the history.
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        max_deltas: int = 50,
+        retention_days: float = 30
+    ):
+        """
+        Initialize snapshot store.
+
+        Args:
+            cache_path: Path to cache file the history belongs to
+            max_deltas: Number of deltas above which compaction is attempted
+            retention_days: Deltas older than this are folded into the base on compaction
+        """
+        cache_path = Path(cache_path)
+        self.snapshot_dir = cache_path.parent / f"{cache_path.stem}_snapshots"
+        self.base_path = self.snapshot_dir / 'base.json'
+        self.deltas_path = self.snapshot_dir / 'deltas.jsonl'
+        self.latest_path = self.snapshot_dir / 'latest.json'
+        self.max_deltas = max_deltas
+        self.retention = timedelta(days=retention_days)
+        self.logger = logging.getLogger(__name__)
+
+    def exists(self) -> bool:
+        return self.base_path.exists() and self.base_path.is_file()
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value)
+
+    @staticmethod
+    def _index(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        return {launch['id']: launch for launch in data if launch.get('id') is not None}
+
+    def _load_base(self) -> tuple[datetime, Dict[str, Dict[str, Any]]]:
+        with open(self.base_path, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        return self._parse_timestamp(base['timestamp']), self._index(base['launches'])
+
+    def _iter_deltas(self) -> Iterator[Dict[str, Any]]:
+        if not self.deltas_path.exists():
+            return
+        with open(self.deltas_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _deltas_size(self) -> int:
+        return self.deltas_path.stat().st_size if self.deltas_path.exists() else 0
+
+    def _load_latest(self) -> Optional[tuple[Dict[str, Dict[str, Any]], int]]:
+        if not self.latest_path.exists():
+            return None
+        try:
+            with open(self.latest_path, 'r', encoding='utf-8') as f:
+                latest = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.debug(f"Error loading latest snapshot: {e}")
+            return None
+        if latest.get('deltas_size') != self._deltas_size():
+            self.logger.debug("Latest snapshot does not match the deltas file, replaying history")
+            return None
+        return self._index(latest['launches']), latest['delta_count']
+
+    def _write_latest(self, state: Dict[str, Dict[str, Any]], delta_count: int) -> None:
+        tmp_path = self.latest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'deltas_size': self._deltas_size(),
+                'delta_count': delta_count,
+                'launches': list(state.values()),
+            }, f)
+        os.replace(tmp_path, self.latest_path)
+
+    def _load_state(self) -> tuple[Dict[str, Dict[str, Any]], int]:
+        """Latest launch state and number of deltas, from latest.json or by replaying the history."""
+        latest = self._load_latest()
+        if latest is not None:
+            return latest
+
+        _, state = self._load_base()
+        delta_count = 0
+        for delta in self._iter_deltas():
+            self._apply(state, delta)
+            delta_count += 1
+        return state, delta_count
+
+    @staticmethod
+    def _apply(state: Dict[str, Dict[str, Any]], delta: Dict[str, Any]) -> None:
+        for launch_id in delta['removed']:
+            state.pop(launch_id, None)
+        for launch_id, change in delta['changed'].items():
+            launch = dict(state[launch_id])
+            launch.update(change['set'])
+            for key in change['unset']:
+                launch.pop(key, None)
+            state[launch_id] = launch
+        for launch in delta['added']:
+            state[launch['id']] = launch
+
+    @staticmethod
+    def _diff(
+        old: Dict[str, Dict[str, Any]],
+        new: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        added = []
+        changed = {}
+        for launch_id, launch in new.items():
+            previous = old.get(launch_id)
+            if previous is None:
+                added.append(launch)
+            elif previous != launch:
+                changed[launch_id] = {
+                    'set': {k: v for k, v in launch.items() if k not in previous or previous[k] != v},
+                    'unset': [k for k in previous if k not in launch],
+                }
+        removed = [launch_id for launch_id in old if launch_id not in new]
+        return {'added': added, 'changed': changed, 'removed': removed}
+
+    def _write_base(self, timestamp: datetime, state: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = self.base_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'timestamp': timestamp.isoformat(), 'launches': list(state.values())}, f)
+        os.replace(tmp_path, self.base_path)
+
+    def record(self, data: List[Dict[str, Any]], timestamp: Optional[datetime] = None) -> bool:
+        """
+        Record a refreshed launch set as a new point in the history.
+
+        Args:
+            data: Full launch list as fetched from the API
+            timestamp: Time of the refresh (default: now, UTC)
+
+        Returns:
+            True if the history was updated, False if nothing changed
+        """
+        timestamp = timestamp or datetime.now(timezone.utc)
+        new_state = self._index(data)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self.exists():
+            self.logger.debug(f"Writing base snapshot with {len(new_state)} launches: {self.base_path}")
+            self._write_base(timestamp, new_state)
+            self._write_latest(new_state, 0)
+            return True
+
+        state, delta_count = self._load_state()
+        delta = self._diff(state, new_state)
+        if not (delta['added'] or delta['changed'] or delta['removed']):
+            self.logger.debug("No launch changes since last snapshot")
+            return False
+
+        self.logger.debug(
+            f"Recording snapshot delta - Added: {len(delta['added'])}, "
+            f"Changed: {len(delta['changed'])}, Removed: {len(delta['removed'])}"
+        )
+        delta['timestamp'] = timestamp.isoformat()
+        with open(self.deltas_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(delta) + '\n')
+        delta_count += 1
+
+        # Only the oldest delta is read to check whether compaction can fold anything,
+        # so deltas within the retention window do not cost a full replay per refresh
+        cutoff = timestamp - self.retention
+        if delta_count > self.max_deltas:
+            oldest = next(self._iter_deltas(), None)
+            if oldest is not None and self._parse_timestamp(oldest['timestamp']) <= cutoff:
+                delta_count -= self.compact(cutoff)
+        self._write_latest(new_state, delta_count)
+        return True
+
+    def compact(self, cutoff: datetime) -> int:
+        """
+        Fold all deltas recorded at or before cutoff into the base snapshot.
+
+        History before the cutoff is no longer reachable with load_as_of afterwards.
+
+        Args:
+            cutoff: Deltas with a timestamp at or before this are folded
+
+        Returns:
+            Number of deltas folded into the base
+        """
+        base_timestamp, state = self._load_base()
+        remaining = []
+        folded = 0
+        for delta in self._iter_deltas():
+            delta_timestamp = self._parse_timestamp(delta['timestamp'])
+            if not remaining and delta_timestamp <= cutoff:
+                self._apply(state, delta)
+                base_timestamp = delta_timestamp
+                folded += 1
+            else:
+                remaining.append(delta)
+
+        if folded == 0:
+            return 0
+
+        self.logger.debug(f"Compacting {folded} snapshot deltas into base, keeping {len(remaining)}")
+        self._write_base(base_timestamp, state)
+        tmp_path = self.deltas_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for delta in remaining:
+                f.write(json.dumps(delta) + '\n')
+        os.replace(tmp_path, self.deltas_path)
+        return folded
+
+    def load_as_of(self, as_of: datetime) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rebuild the launch set as it was at a given time.
+
+        Loads the base once and applies deltas in order, stopping at the first
+        delta recorded after as_of.
+
+        Args:
+            as_of: Point in time to rebuild (timezone-aware)
+
+        Returns:
+            List of launch dictionaries, or None if no history covers as_of
+        """
+        if not self.exists():
+            self.logger.debug(f"No snapshot history: {self.snapshot_dir}")
+            return None
+
+        try:
+            base_timestamp, state = self._load_base()
+            if base_timestamp > as_of:
+                self.logger.debug(f"Snapshot history starts at {base_timestamp.isoformat()}, after {as_of.isoformat()}")
+                return None
+
+            applied = 0
+            for delta in self._iter_deltas():
+                if self._parse_timestamp(delta['timestamp']) > as_of:
+                    break
+                self._apply(state, delta)
+                applied += 1
+        except (json.JSONDecodeError, KeyError, IOError) as e:
+            self.logger.debug(f"Error loading snapshot history: {e}")
+            return None
+
+        self.logger.debug(f"Rebuilt {len(state)} launches as of {as_of.isoformat()} from base + {applied} deltas")
+        return list(state.values())
@@ -2,8 +2,9 @@
 Data filtering utilities for launch data.
 """
 import logging
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, Optional
 from datetime import datetime
+from .LaunchDate import parse_launch_date
 
 
 class DateFilter:
@@ -20,6 +21,19 @@ class DateFilter:
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"Initialized DateFilter for year: {year}")
     
+    def matches(self, launch: Dict[str, Any], launch_date: Optional[datetime]) -> bool:
+        """
+        Check whether a single launch passes the filter.
+        
+        Args:
+            launch: Launch dictionary
+            launch_date: Pre-parsed launch date (None if missing or invalid)
+        
+        Returns:
+            True if the launch falls in the filter year
+        """
+        return launch_date is not None and launch_date.year == self.year
+    
     def filter(self, data: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """
         Filter launches by year.
@@ -35,22 +49,14 @@ class DateFilter:
         self.logger.debug(f"DateFilter, filtering by year: {self.year}")
 
         for launch in data:
-            date_utc = launch.get('date_utc')
-            if not date_utc:
+            launch_date = parse_launch_date(launch)
+            if launch_date is None:
+                # Skip entries with missing or invalid dates
                 skipped_count += 1
                 continue
             
-            try:
-                # Parse ISO format date (e.g., "2022-01-01T00:00:00.000Z")
-                # Handle 'Z' timezone indicator
-                date_str = date_utc.replace('Z', '+00:00') if date_utc.endswith('Z') else date_utc
-                launch_date = datetime.fromisoformat(date_str)
-                if launch_date.year == self.year:
-                    matched_count += 1
-                    yield launch
-            except (ValueError, AttributeError, TypeError):
-                # Skip entries with invalid dates
-                skipped_count += 1
-                continue
+            if self.matches(launch, launch_date):
+                matched_count += 1
+                yield launch
         
         self.logger.debug(f"DateFilter matched {matched_count} launches, skipped {skipped_count}")
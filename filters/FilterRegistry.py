@@ -2,7 +2,8 @@
 Filter Registry - maps filter names to filter classes.
 """
 import logging
-from typing import Dict, Callable, Iterator, Type
+from typing import Dict, Callable, Iterator, Type, Any, Optional
+from datetime import datetime
 from .DateFilter import DateFilter
 from .StatusFilter import StatusFilter
 
@@ -10,25 +11,58 @@ from .StatusFilter import StatusFilter
 class FilterRegistry:
     """Registry for mapping filter names to filter classes."""
     
-    _filters: Dict[str, Callable] = {
-        'by_year': lambda **kwargs: DateFilter(**kwargs).filter,
-        'by_year_and_status': lambda **kwargs: StatusFilter(**kwargs).filter,
+    _filters: Dict[str, Type] = {
+        'by_year': DateFilter,
+        'by_year_and_status': StatusFilter,
     }
     
     @classmethod
-    def get_filter(cls, filter_name: str, **kwargs) -> Callable[[Iterator], Iterator]:
+    def create(cls, filter_name: str, **kwargs):
+        """
+        Create a filter instance.
+        
+        Args:
+            filter_name: Filter name
+            **kwargs: Filter arguments
+        
+        Returns:
+            Filter instance
+        
+        Raises:
+            ValueError: If filter is not registered
+        """
         logger = logging.getLogger(__name__)
         logger.debug(f"Getting filter: {filter_name} with kwargs: {kwargs}")
         
         if filter_name not in cls._filters:
             raise ValueError(f"Unknown filter: {filter_name}")
         
-        filter_method = cls._filters[filter_name]
-        return filter_method(**kwargs)
+        return cls._filters[filter_name](**kwargs)
+    
+    @classmethod
+    def get_filter(cls, filter_name: str, **kwargs) -> Callable[[Iterator], Iterator]:
+        """Get the iterator-to-iterator filter function for a filter."""
+        return cls.create(filter_name, **kwargs).filter
     
     @classmethod
-    def register(cls, filter_name: str, filter_func: Callable):
-        cls._filters[filter_name] = filter_func
+    def get_predicate(
+        cls,
+        filter_name: str,
+        **kwargs
+    ) -> Callable[[Dict[str, Any], Optional[datetime]], bool]:
+        """Get the per-launch predicate (launch, launch_date) -> bool for a filter."""
+        return cls.create(filter_name, **kwargs).matches
+    
+    @classmethod
+    def register(cls, filter_name: str, filter_class: Type):
+        """
+        Register a new filter.
+        
+        Args:
+            filter_name: Filter name
+            filter_class: Filter class providing filter() and matches()
+        """
+        cls._filters[filter_name] = filter_class
     
     @classmethod
     def list_filters(cls) -> list[str]:
@@ -0,0 +1,28 @@
+"""
+Launch date parsing shared by the date-based filters.
+"""
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+
+def parse_launch_date(launch: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Parse the 'date_utc' field of a launch.
+    
+    Args:
+        launch: Launch dictionary
+    
+    Returns:
+        Parsed datetime, or None if the date is missing or invalid
+    """
+    date_utc = launch.get('date_utc')
+    if not date_utc:
+        return None
+    
+    try:
+        # Parse ISO format date (e.g., "2022-01-01T00:00:00.000Z")
+        # Handle 'Z' timezone indicator
+        date_str = date_utc.replace('Z', '+00:00') if date_utc.endswith('Z') else date_utc
+        return datetime.fromisoformat(date_str)
+    except (ValueError, AttributeError, TypeError):
+        return None
@@ -4,6 +4,7 @@ Status filtering utilities for launch data.
 import logging
 from typing import Iterator, Dict, Any, Optional
 from datetime import datetime
+from .LaunchDate import parse_launch_date
 
 
 class StatusFilter:
@@ -22,6 +23,23 @@ class StatusFilter:
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"Initialized StatusFilter for year: {year}, status: {status}")
     
+    def matches(self, launch: Dict[str, Any], launch_date: Optional[datetime]) -> bool:
+        """
+        Check whether a single launch passes the filter.
+        
+        Args:
+            launch: Launch dictionary
+            launch_date: Pre-parsed launch date (None if missing or invalid)
+        
+        Returns:
+            True if the launch matches the year and status
+        """
+        if launch_date is None or launch_date.year != self.year:
+            return False
+        
+        # Filter by status if specified
+        return self.status is None or launch.get('success') == self.status
+    
     def filter(self, data: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """
         Filter launches by year and status (success).
@@ -36,32 +54,10 @@ class StatusFilter:
         skipped_count = 0
         
         for launch in data:
-            # Filter by year
-            date_utc = launch.get('date_utc')
-            if not date_utc:
+            if not self.matches(launch, parse_launch_date(launch)):
                 skipped_count += 1
                 continue
             
-            try:
-                # Parse ISO format date (e.g., "2022-01-01T00:00:00.000Z")
-                # Handle 'Z' timezone indicator
-                date_str = date_utc.replace('Z', '+00:00') if date_utc.endswith('Z') else date_utc
-                launch_date = datetime.fromisoformat(date_str)
-                if launch_date.year != self.year:
-                    skipped_count += 1
-                    continue
-            except (ValueError, AttributeError, TypeError):
-                # Skip entries with invalid dates
-                skipped_count += 1
-                continue
-            
-            # Filter by status if specified
-            if self.status is not None:
-                success = launch.get('success')
-                if success != self.status:
-                    skipped_count += 1
-                    continue
-            
             matched_count += 1
             yield launch
         
@@ -0,0 +1,92 @@
+"""
+HyperLogLog sketch for approximate distinct counting.
+"""
+import math
+import base64
+import hashlib
+from typing import Dict, Any
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter (Flajolet et al. 2007) over string items.
+    
+    Uses 2^precision one-byte registers and a 64-bit hash. The relative
+    standard error of count() is about 1.04 / sqrt(2^precision), e.g. 0.81% at
+    the default precision 14 with 16 KiB of registers. Small cardinalities use
+    linear counting and are near exact. Sketches with equal precision merge
+    losslessly by taking the register-wise maximum.
+    """
+    
+    def __init__(self, precision: int = 14):
+        """
+        Initialize sketch.
+        
+        Args:
+            precision: Number of index bits, between 4 and 18
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+    
+    def add(self, item: str) -> None:
+        """Record an occurrence of item."""
+        hashed = int.from_bytes(
+            hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(),
+            'big'
+        )
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def relative_error(self) -> float:
+        """Relative standard error of count()."""
+        return 1.04 / math.sqrt(self.num_registers)
+    
+    def count(self) -> int:
+        """Estimate the number of distinct items added."""
+        m = self.num_registers
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+    
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Merge another sketch into this one.
+        
+        Args:
+            other: Sketch with the same precision
+        
+        Returns:
+            self
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precisions")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch state to a JSON-compatible dictionary."""
+        return {
+            'precision': self.precision,
+            'registers': base64.b64encode(bytes(self.registers)).decode('ascii'),
+        }
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'HyperLogLog':
+        """Restore a sketch serialized with to_dict()."""
+        sketch = cls(state['precision'])
+        sketch.registers = bytearray(base64.b64decode(state['registers']))
+        return sketch
@@ -0,0 +1,137 @@
+"""
+Space-Saving heavy hitters sketch for approximate top-K counting.
+"""
+import heapq
+from typing import Dict, Any, List, Tuple
+
+
+class SpaceSaving:
+    """
+    Space-Saving top-K sketch (Metwally, Agrawal, El Abbadi 2005) over string items.
+    
+    Monitors at most `capacity` items. When a new item arrives and all counters
+    are taken, the item with the smallest count is evicted and the newcomer
+    inherits that count as its error. Error bounds, with N the total number of
+    items added:
+    - estimate - error <= true count <= estimate for every monitored item
+    - error <= N / capacity, so any item with true count > N / capacity is monitored
+    Memory is O(capacity) and each add() is O(log capacity) amortized. Sketches
+    with equal capacity can be merged, with the same N / capacity bound on the
+    combined stream.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize sketch.
+        
+        Args:
+            capacity: Number of counters (items monitored at once)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # Min-heap of (count, item); entries whose count is outdated are skipped lazily
+        self._heap: List[Tuple[int, str]] = []
+    
+    def add(self, item: str, count: int = 1) -> None:
+        """Count an occurrence of item."""
+        self.total += count
+        
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            min_item, min_count = self._pop_min()
+            del self.counts[min_item]
+            del self.errors[min_item]
+            self.counts[item] = min_count + count
+            self.errors[item] = min_count
+        
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+    
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+    
+    def _pop_min(self) -> Tuple[str, int]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+    
+    def min_count(self) -> int:
+        """Smallest monitored count, or 0 while counters are still free."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+    
+    def max_error(self) -> int:
+        """Upper bound on the overestimate of any reported count."""
+        return self.total // self.capacity
+    
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        """
+        Get the k items with the highest estimated counts.
+        
+        Returns:
+            List of (item, estimated count, error) sorted by count descending
+        """
+        ranked = heapq.nlargest(k, self.counts.items(), key=lambda x: x[1])
+        return [(item, count, self.errors[item]) for item, count in ranked]
+    
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """
+        Merge another sketch into this one.
+        
+        An item missing from a full sketch may have been evicted there, so it is
+        charged that sketch's minimum count as both estimate and error.
+        
+        Args:
+            other: Sketch with the same capacity
+        
+        Returns:
+            self
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge SpaceSaving sketches with different capacities")
+        
+        self_min, other_min = self.min_count(), other.min_count()
+        merged = {}
+        for item in set(self.counts) | set(other.counts):
+            merged[item] = (
+                self.counts.get(item, self_min) + other.counts.get(item, other_min),
+                self.errors.get(item, self_min) + other.errors.get(item, other_min),
+            )
+        
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda x: x[1][0])
+        self.counts = {item: count for item, (count, _) in kept}
+        self.errors = {item: error for item, (_, error) in kept}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch state to a JSON-compatible dictionary."""
+        return {
+            'capacity': self.capacity,
+            'total': self.total,
+            'counters': [[item, count, self.errors[item]] for item, count in self.counts.items()],
+        }
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'SpaceSaving':
+        """Restore a sketch serialized with to_dict()."""
+        sketch = cls(state['capacity'])
+        sketch.total = state['total']
+        for item, count, error in state['counters']:
+            sketch.counts[item] = count
+            sketch.errors[item] = error
+        sketch._rebuild_heap()
+        return sketch
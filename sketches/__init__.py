@@ -0,0 +1,3 @@
+"""
+Sketches package - bounded-memory approximate summaries for high-cardinality data.
+"""
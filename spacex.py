@@ -2,11 +2,27 @@
 """
 SpaceX Launch Data CLI - Fetches and analyzes SpaceX launch data.
 """
-from ArgumentParser import parse_args
+from ArgumentParser import create_parser, parse_args
 from Pipeline import Pipeline
+from BatchPipeline import BatchPipeline
+from WatchPipeline import WatchPipeline
 from LoggerConfig import setup_logging
 
 
+def action_options(args) -> dict:
+    """Build action handler options from command line arguments."""
+    options = {}
+    if args.group_by is not None:
+        options['key'] = args.group_by
+    if args.window is not None:
+        options['window'] = args.window
+    if args.approx:
+        options['approx'] = True
+    if args.top_k is not None:
+        options['top_k'] = args.top_k
+    return options
+
+
 def main():
     """Main CLI entry point."""
     args = parse_args()
@@ -14,11 +30,30 @@ def main():
     # Setup logging before creating pipeline
     setup_logging(verbose=args.verbose)
     
+    if args.batch:
+        try:
+            BatchPipeline(cache_path=args.cache).load_queries(args.batch) \
+                .fetch_data(args.refresh, args.as_of) \
+                .run_queries() \
+                .print_result()
+        except (ValueError, OSError) as e:
+            create_parser().error(f"argument --batch: {e}")
+        return
+    
+    if args.watch:
+        watch_pipeline = WatchPipeline(cache_path=args.cache)
+        if not args.all_years:
+            watch_pipeline.filter_data('by_year', year=2022)
+        watch_pipeline.perform_action(args.action, **action_options(args)) \
+            .watch(interval=args.interval, refresh=args.refresh)
+        return
+    
     # Create pipeline and process data with fluent interface
     pipeline = Pipeline(cache_path=args.cache)
-    pipeline.fetch_data(args.refresh) \
-            .filter_data('by_year', year=2022) \
-            .perform_action(args.action) \
+    pipeline.fetch_data(args.refresh, args.as_of)
+    if not args.all_years:
+        pipeline.filter_data('by_year', year=2022)
+    pipeline.perform_action(args.action, **action_options(args)) \
             .print_result()
 
 
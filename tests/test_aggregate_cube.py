@@ -0,0 +1,175 @@
+"""
+Consistency tests: answers rolled up from the aggregate cube must match the scan path.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from Pipeline import Pipeline
+from actions.ActionRegistry import ActionRegistry
+from data.CacheManager import CacheManager
+from data.LaunchDataAccess import LaunchDataAccess
+from filters.FilterRegistry import FilterRegistry
+from filters.LaunchDate import parse_launch_date
+
+
+SAMPLE_PATH = Path(__file__).resolve().parent.parent / 'cache' / 'launches_all.json'
+
+# Launches the cube keeps under a None year, plus an unknown outcome and launchpad
+SYNTHETIC_LAUNCHES = [
+    {'id': 'synthetic-undated', 'flight_number': 9001, 'success': True,
+     'launchpad': '5e9e4501f509094ba4566f84', 'payloads': ['a', 'b']},
+    {'id': 'synthetic-invalid-date', 'flight_number': 9002, 'date_utc': 'not-a-date', 'success': False,
+     'launchpad': '5e9e4502f509094188566f88', 'payloads': ['c']},
+    {'id': 'synthetic-null-date', 'flight_number': 9003, 'date_utc': None, 'success': None,
+     'payloads': []},
+]
+
+CUBE_ACTIONS = [
+    ('report', {}),
+    ('payloads', {}),
+    ('launchpads', {}),
+    ('launchpads', {'top_k': 2}),
+    ('launchpads', {'approx': True}),
+    ('launchpads', {'approx': True, 'top_k': 3}),
+]
+
+
+def build_cache(cache_path: str, data: list) -> LaunchDataAccess:
+    """Populate cache, partitions and cube through a refresh with a stubbed API call."""
+    data_access = LaunchDataAccess(cache_path)
+    data_access.api_caller.fetch = lambda url: (data, None, None)
+    data_iterator = data_access.fetch(refresh=True, onError=lambda code, message: None)
+    list(data_iterator)
+    return data_access
+
+
+def scan_answer(data: list, filters: list, action: str, options: dict) -> str:
+    """Answer a query by filtering and scanning the launch list."""
+    data_iterator = iter(data)
+    for filter_name, kwargs in filters:
+        data_iterator = FilterRegistry.get_filter(filter_name, **kwargs)(data_iterator)
+    return ActionRegistry.get_action(action).execute(data_iterator, **options)
+
+
+class AggregateCubeConsistencyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(SAMPLE_PATH, 'r', encoding='utf-8') as f:
+            cls.data = json.load(f) + SYNTHETIC_LAUNCHES
+        cls.directory = tempfile.mkdtemp()
+        cls.cache_path = os.path.join(cls.directory, 'launches.json')
+        build_cache(cls.cache_path, cls.data)
+
+        years = {launch_date.year for launch_date in map(parse_launch_date, cls.data) if launch_date}
+        # One year past the data to cover an empty selection
+        cls.years = sorted(years) + [max(years) + 1]
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def cube_answer(self, filters: list, action: str, options: dict) -> str:
+        pipeline = Pipeline(self.cache_path).fetch_data()
+        for filter_name, kwargs in filters:
+            pipeline.filter_data(filter_name, **kwargs)
+        result = pipeline._execute_from_cube(ActionRegistry.get_action(action), options)
+        self.assertIsNotNone(result, f"cube did not answer {filters}")
+        return result
+
+    def assert_consistent(self, filters: list) -> None:
+        for action, options in CUBE_ACTIONS:
+            with self.subTest(filters=filters, action=action, options=options):
+                self.assertEqual(
+                    self.cube_answer(filters, action, options),
+                    scan_answer(self.data, filters, action, options)
+                )
+
+    def test_no_filter(self):
+        self.assert_consistent([])
+
+    def test_by_year(self):
+        for year in self.years:
+            self.assert_consistent([('by_year', {'year': year})])
+
+    def test_by_year_and_status(self):
+        for year in self.years:
+            for status in (True, False, None):
+                self.assert_consistent([('by_year_and_status', {'year': year, 'status': status})])
+
+    def test_by_year_and_status_default_status(self):
+        for year in self.years:
+            self.assert_consistent([('by_year_and_status', {'year': year})])
+
+    def test_chained_filters(self):
+        for year in self.years:
+            for status in (True, False, None):
+                self.assert_consistent([
+                    ('by_year', {'year': year}),
+                    ('by_year_and_status', {'year': year, 'status': status}),
+                ])
+        # Contradictory years select nothing
+        self.assert_consistent([('by_year', {'year': 2020}), ('by_year', {'year': 2021})])
+
+
+class AggregateCubeRoutingTest(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r', encoding='utf-8') as f:
+            self.data = json.load(f) + SYNTHETIC_LAUNCHES
+        self.directory = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'launches.json')
+        self.data_access = build_cache(self.cache_path, self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_current_cube_answers_without_scan(self):
+        self.assertTrue(self.data_access.has_cube())
+
+        handler_class = ActionRegistry.get_action('report')
+        filters = [('by_year', {'year': 2022})]
+        with mock.patch.object(Pipeline, '_execute_from_cube', autospec=True,
+                               side_effect=Pipeline._execute_from_cube) as execute_from_cube, \
+                mock.patch.object(handler_class, 'execute', wraps=handler_class.execute) as execute, \
+                mock.patch.object(CacheManager, 'load') as load, \
+                mock.patch.object(CacheManager, 'load_partition') as load_partition:
+            pipeline = Pipeline(self.cache_path).fetch_data()
+            for filter_name, kwargs in filters:
+                pipeline.filter_data(filter_name, **kwargs)
+            pipeline.perform_action('report')
+
+        execute_from_cube.assert_called_once()
+        execute.assert_not_called()
+        load.assert_not_called()
+        load_partition.assert_not_called()
+        self.assertEqual(pipeline.result, scan_answer(self.data, filters, 'report', {}))
+
+    def test_stale_cube_falls_back_to_scan(self):
+        self.assertTrue(self.data_access.has_cube())
+
+        stat = os.stat(self.cache_path)
+        os.utime(self.cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertFalse(self.data_access.has_cube())
+
+        handler_class = ActionRegistry.get_action('report')
+        filters = [('by_year', {'year': 2022})]
+        with mock.patch.object(Pipeline, '_execute_from_cube') as execute_from_cube, \
+                mock.patch.object(handler_class, 'execute', wraps=handler_class.execute) as execute:
+            pipeline = Pipeline(self.cache_path).fetch_data()
+            for filter_name, kwargs in filters:
+                pipeline.filter_data(filter_name, **kwargs)
+            pipeline.perform_action('report')
+
+        execute_from_cube.assert_not_called()
+        execute.assert_called_once()
+        self.assertEqual(pipeline.result, scan_answer(self.data, filters, 'report', {}))
+
+
+if __name__ == '__main__':
+    unittest.main()